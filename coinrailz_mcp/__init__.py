@@ -24,94 +24,550 @@ QUICK START (No API key needed!):
 __version__ = "1.2.0"
 
 import os
+import time
+import random
+import re
 import asyncio
 import json
-import uuid
+import logging
+import secrets
+import sys
 import hashlib
-from typing import Any, Optional, List
+import inspect
+import functools
+import importlib.util
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Annotated, Any, Optional, List, Sequence
 from pathlib import Path
+from urllib.parse import quote
 import httpx
 
 try:
     from mcp.server.fastmcp import FastMCP
+    from mcp.types import CallToolResult, TextContent
 except ImportError:
     print("MCP SDK not installed. Run: pip install mcp")
     raise
 
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+    
+    def _canonical_json(obj: Any) -> bytes:
+        """Serialize a payload with sorted keys for use in cache keys."""
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+    
+    def _tool_text(obj: Any) -> str:
+        """Render a tool result as the JSON text sent to the client."""
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if PRETTY_OUTPUT else 0)
+        return orjson.dumps(obj, default=str, option=option).decode()
+else:
+    _loads = json.loads
+    
+    def _dumps(obj: Any) -> bytes:
+        """Serialize a request body to compact JSON."""
+        return json.dumps(obj, separators=(",", ":")).encode()
+    
+    def _canonical_json(obj: Any) -> bytes:
+        """Serialize a payload with sorted keys for use in cache keys."""
+        return json.dumps(obj, sort_keys=True, separators=(",", ":")).encode()
+    
+    def _tool_text(obj: Any) -> str:
+        """Render a tool result as the JSON text sent to the client."""
+        if PRETTY_OUTPUT:
+            return json.dumps(obj, default=str, indent=2)
+        return json.dumps(obj, default=str, separators=(",", ":"))
+
 COINRAILZ_BASE_URL = os.getenv("COINRAILZ_BASE_URL", "https://coinrailz.com")
 COINRAILZ_API_KEY = os.getenv("COINRAILZ_API_KEY", "")
 
 FREE_TIER_SERVICES = {"gas-price-oracle", "token-metadata"}
 
+_USER_AGENT = f"CoinRailz-MCP-Server/{__version__}"
+# Sent with every request by the shared client; httpx adds Content-Type for JSON bodies.
+_BASE_HEADERS = {"User-Agent": _USER_AGENT}
+
+DEMO_KEY_TTL_SECONDS = 24 * 60 * 60
+# After a failed demo-key fetch, don't try again for this long.
+DEMO_KEY_RETRY_COOLDOWN_SECONDS = 300
+
+# Seconds a successful response may be reused for identical requests.
+# Services not listed here are never cached.
+CACHE_TTL_SECONDS = {
+    "gas-price-oracle": 15,
+    "token-metadata": 3600,
+    "trending-tokens": 60,
+    "polymarket-events": 30,
+    "stock-sentiment": 30,
+    "forex-sentiment": 30,
+    "token-sentiment": 60,
+    "sentiment-analysis": 60,
+}
+# Seconds past expiry that a cached result may still be served while a fresh
+# one is fetched in the background (stale-while-revalidate).
+CACHE_STALE_SECONDS = {
+    "stock-sentiment": 30,
+    "forex-sentiment": 30,
+}
+CACHE_MAX_ENTRIES = 512
+CACHE_DISABLED = os.getenv("COINRAILZ_DISABLE_CACHE", "") == "1"
+
+# Tool results are sent as compact JSON text; MCP_PRETTY=1 indents it for reading.
+PRETTY_OUTPUT = os.getenv("MCP_PRETTY", "") == "1"
+
+# Services with side effects (wallets, registrations, service requests).
+# Their calls are never cached or coalesced with one another.
+NON_IDEMPOTENT_SERVICES = {
+    "agent-create-wallet",
+    "instant-agent-wallet",
+    "verified-agent-identity",
+    "smart-contract-audit",
+    "payment-processing",
+    "compliance-consultation",
+}
+
+# Defaults used when a tool is called without an explicit chain/source/currency list.
+_DEFAULT_GAS_CHAINS = ("ethereum", "base", "polygon", "arbitrum", "optimism")
+_DEFAULT_WHALE_CHAINS = ("ethereum", "base", "polygon")
+_DEFAULT_ARB_CHAINS = ("ethereum", "base", "polygon", "arbitrum")
+_DEFAULT_BALANCE_CHAINS = ("ethereum", "base", "polygon", "bsc", "arbitrum", "optimism")
+_DEFAULT_PORTFOLIO_CHAINS = ("ethereum", "base", "polygon", "arbitrum")
+_DEFAULT_SENTIMENT_SOURCES = ("twitter", "reddit", "news")
+_DEFAULT_CURRENCIES = ("USDC", "ETH", "USDT")
+
+# Stock tickers and forex pairs: short ASCII symbols such as BRK.B or EUR/USD.
+TICKER_MAX_LENGTH = 16
+_TICKER_RE = re.compile(r"[A-Za-z0-9./-]+")
+
+# Long-running services. They are called with "X-Async: 1" so the API may
+# answer 202 with a jobId instead of holding the connection open; the result
+# is then fetched with the poll_coinrailz_job tool.
+ASYNC_JOB_SERVICES = {
+    "contract-scan",
+    "lease-analysis",
+    "property-valuation",
+    "portfolio-optimization",
+    "credit-risk-score",
+}
+JOB_POLL_AFTER_SECONDS = 5
+
+# Per-phase request timeouts: connects and pool waits fail fast, while the
+# read budget is widened or narrowed for services with known response times.
+DEFAULT_TIMEOUT = httpx.Timeout(connect=5.0, read=60.0, write=10.0, pool=5.0)
+_FAST_TIMEOUT = httpx.Timeout(connect=5.0, read=10.0, write=10.0, pool=5.0)
+_SLOW_TIMEOUT = httpx.Timeout(connect=5.0, read=120.0, write=10.0, pool=5.0)
+SERVICE_TIMEOUTS = {
+    "ping": _FAST_TIMEOUT,
+    "gas-price-oracle": _FAST_TIMEOUT,
+    "token-metadata": _FAST_TIMEOUT,
+    "polymarket-odds": _FAST_TIMEOUT,
+    "jobs": _FAST_TIMEOUT,
+    "contract-scan": _SLOW_TIMEOUT,
+    "portfolio-optimization": _SLOW_TIMEOUT,
+    "credit-risk-score": _SLOW_TIMEOUT,
+}
+
+# Maximum number of tool calls accepted by one batch_call request.
+BATCH_MAX_CALLS = 20
+
+# Transient failures are retried with exponential backoff (plus jitter), or
+# after the server's Retry-After delay when it sends one.
+RETRY_STATUS_CODES = {408, 425, 429, 500, 502, 503, 504}
+MAX_ATTEMPTS = 4
+RETRY_BACKOFF_MAX_SECONDS = 8
+RETRY_AFTER_MAX_SECONDS = 30
+
+# Failures where the request never reached the server, so even
+# non-idempotent calls can be retried safely.
+_NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+# Statuses for which the server turned the request away without processing
+# (or billing) it, so non-idempotent calls may be retried too.
+_NOT_PROCESSED_STATUS_CODES = {429, 503}
+
+# Circuit breaker: after this many consecutive failures (transport errors,
+# 429 or 5xx) a service is skipped for BREAKER_COOLDOWN_SECONDS.
+BREAKER_FAILURE_THRESHOLD = 5
+BREAKER_COOLDOWN_SECONDS = 10
+
+# Upper bound on concurrent requests to the Coin Railz API.
+MAX_CONCURRENCY = int(os.getenv("COINRAILZ_MAX_CONCURRENCY", "64"))
+
+# HTTP/2 lets concurrent tool calls share one multiplexed connection. It needs
+# the h2 package (httpx[http2]) and can be turned off with COINRAILZ_HTTP2=0.
+HTTP2_ENABLED = (
+    os.getenv("COINRAILZ_HTTP2", "1") != "0"
+    and importlib.util.find_spec("h2") is not None
+)
+
+# Opt-in request coalescing: service calls made within this many milliseconds
+# of each other are sent together as one POST to /x402/batch. 0 disables it.
+REQUEST_BATCH_WINDOW_MS = int(os.getenv("COINRAILZ_BATCH_WINDOW_MS", "0"))
+REQUEST_BATCH_MAX_SIZE = 20
+
+# Minimum spacing between "usage" telemetry events.
+USAGE_TELEMETRY_INTERVAL_SECONDS = 60 * 60
+# Telemetry events are queued and posted in batches of up to this many.
+TELEMETRY_BATCH_SIZE = 50
+TELEMETRY_FLUSH_INTERVAL_SECONDS = 30
+
 _telemetry_sent = False
-_install_id = None
+_last_usage_telemetry: Optional[float] = None
+_telemetry_queue: asyncio.Queue = asyncio.Queue(maxsize=1024)
+_telemetry_flusher: Optional[asyncio.Task] = None
+_telemetry_batch_supported = True
+_demo_key_cache: Optional[str] = None
+# time.monotonic() deadline after which _demo_key_cache is re-fetched.
+_demo_key_expires_at = 0.0
+_demo_key_failed_until = 0.0
+_demo_key_lock = asyncio.Lock()
+_client: Optional[httpx.AsyncClient] = None
+_cache: "OrderedDict[str, tuple[float, Any]]" = OrderedDict()
+_inflight: dict[str, asyncio.Task] = {}
+_breakers: dict[str, tuple[int, float]] = {}
+_request_semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+_request_batch_pending: list[tuple[str, Optional[dict], asyncio.Future]] = []
+_request_batch_full = asyncio.Event()
+_request_batch_flusher: Optional[asyncio.Task] = None
+_request_batch_supported = True
+# Event loop the loop-bound state above (client, queue, tasks, ...) belongs to.
+_bound_loop: Optional[asyncio.AbstractEventLoop] = None
+
+def _check_event_loop() -> None:
+    """
+    Rebuild loop-bound module state when called from a new event loop.
+    
+    call_coinrailz_service may be driven by successive asyncio.run() calls;
+    the pooled client, locks, queues and tasks of a previous (possibly closed)
+    loop cannot be used from another one. Queued telemetry is carried over.
+    """
+    global _bound_loop, _client, _telemetry_queue, _telemetry_flusher
+    global _request_semaphore, _request_batch_full, _request_batch_flusher, _demo_key_lock
+    loop = asyncio.get_running_loop()
+    if loop is _bound_loop:
+        return
+    if _bound_loop is not None:
+        # The old client's connections belong to the old loop and cannot be
+        # closed from this one; drop it along with the other loop-bound state.
+        _client = None
+        queued = _drain_telemetry_queue(_telemetry_queue.qsize())
+        _telemetry_queue = asyncio.Queue(maxsize=1024)
+        for event in queued:
+            _telemetry_queue.put_nowait(event)
+        _telemetry_flusher = None
+        _request_semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+        _demo_key_lock = asyncio.Lock()
+        _request_batch_pending.clear()
+        _request_batch_full = asyncio.Event()
+        _request_batch_flusher = None
+        _inflight.clear()
+    _bound_loop = loop
+
+async def _get_client() -> httpx.AsyncClient:
+    """Get the shared pooled HTTP client, creating it on first use."""
+    global _client
+    _check_event_loop()
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            base_url=COINRAILZ_BASE_URL,
+            timeout=DEFAULT_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=32,
+                keepalive_expiry=60,
+            ),
+            http2=HTTP2_ENABLED,
+            headers=_BASE_HEADERS,
+        )
+    return _client
+
+async def _close_client() -> None:
+    """Close the shared HTTP client, if one was created."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+def _get_config_dir() -> Path:
+    """Get the per-user SDK config directory, creating it if needed."""
+    config_dir = Path.home() / ".coinrailz"
+    config_dir.mkdir(exist_ok=True)
+    return config_dir
 
+@functools.lru_cache(maxsize=1)
 def _get_install_id() -> str:
     """Get or create a persistent install ID for this SDK instance."""
-    global _install_id
-    if _install_id:
-        return _install_id
-    
-    config_dir = Path.home() / ".coinrailz"
-    config_dir.mkdir(exist_ok=True)
-    install_file = config_dir / "install_id"
+    install_file = _get_config_dir() / "install_id"
     
     if install_file.exists():
-        _install_id = install_file.read_text().strip()
-    else:
-        _install_id = f"mcp-{uuid.uuid4().hex[:16]}"
-        install_file.write_text(_install_id)
+        return install_file.read_text().strip()
     
-    return _install_id
+    install_id = f"mcp-{secrets.token_hex(8)}"
+    install_file.write_text(install_id)
+    return install_id
 
-async def _send_telemetry(event: str = "usage"):
-    """Send anonymous telemetry to help improve the SDK."""
-    global _telemetry_sent
+def _send_telemetry(event: str = "usage") -> None:
+    """
+    Queue anonymous telemetry to help improve the SDK.
+    
+    Never blocks: events are posted in batches by a background task, usage
+    events are sent at most once per USAGE_TELEMETRY_INTERVAL_SECONDS, and
+    events are dropped if the queue is full.
+    """
+    global _telemetry_sent, _last_usage_telemetry, _telemetry_flusher
     if _telemetry_sent and event == "install":
         return
+    if event == "usage":
+        now = time.monotonic()
+        if (_last_usage_telemetry is not None
+                and now - _last_usage_telemetry < USAGE_TELEMETRY_INTERVAL_SECONDS):
+            return
+        _last_usage_telemetry = now
     
     try:
-        install_id = _get_install_id()
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            await client.post(
-                f"{COINRAILZ_BASE_URL}/api/sdk/telemetry",
-                json={
-                    "installId": install_id,
-                    "sdkType": "python-mcp",
-                    "sdkVersion": __version__,
-                    "event": event,
-                    "environment": {
-                        "hasApiKey": bool(COINRAILZ_API_KEY),
-                        "baseUrl": COINRAILZ_BASE_URL
-                    }
-                },
-                headers={"User-Agent": f"CoinRailz-MCP-Server/{__version__}"}
-            )
-        _telemetry_sent = True
+        _telemetry_queue.put_nowait({
+            "installId": _get_install_id(),
+            "sdkType": "python-mcp",
+            "sdkVersion": __version__,
+            "event": event,
+            "environment": {
+                "hasApiKey": bool(COINRAILZ_API_KEY),
+                "baseUrl": COINRAILZ_BASE_URL
+            }
+        })
     except Exception:
-        pass
+        return
+    _telemetry_sent = True
+    
+    if _telemetry_flusher is None or _telemetry_flusher.done():
+        _telemetry_flusher = asyncio.create_task(_flush_telemetry_forever())
 
-async def _get_demo_key() -> Optional[str]:
-    """Automatically fetch a demo API key with $1 trial credits."""
+def _drain_telemetry_queue(limit: int) -> list:
+    """Take up to `limit` queued telemetry events without waiting."""
+    events = []
+    while len(events) < limit:
+        try:
+            events.append(_telemetry_queue.get_nowait())
+        except asyncio.QueueEmpty:
+            break
+    return events
+
+async def _post_telemetry(events: list) -> None:
+    """Post telemetry events, one request per event if the batch endpoint is missing."""
+    global _telemetry_batch_supported
     try:
-        install_id = _get_install_id()
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        client = await _get_client()
+        if _telemetry_batch_supported:
             response = await client.post(
-                f"{COINRAILZ_BASE_URL}/api/sdk/demo-key",
-                json={
-                    "installId": install_id,
-                    "sdkType": "python-mcp"
-                },
-                headers={"User-Agent": f"CoinRailz-MCP-Server/{__version__}"}
+                "/api/sdk/telemetry/batch",
+                json={"events": events},
+                timeout=5.0
             )
-            if response.status_code == 200:
-                data = response.json()
-                return data.get("api_key")
+            if response.status_code not in (404, 405):
+                return
+            _telemetry_batch_supported = False
+        for event in events:
+            await client.post("/api/sdk/telemetry", json=event, timeout=5.0)
     except Exception:
         pass
+
+async def _flush_telemetry_forever() -> None:
+    """Background task: post queued telemetry in batches."""
+    while True:
+        events = [await _telemetry_queue.get()]
+        events.extend(_drain_telemetry_queue(TELEMETRY_BATCH_SIZE - 1))
+        await _post_telemetry(events)
+        await asyncio.sleep(TELEMETRY_FLUSH_INTERVAL_SECONDS)
+
+async def _stop_telemetry(timeout: float) -> None:
+    """Stop the background flusher and post whatever is still queued."""
+    global _telemetry_flusher
+    _check_event_loop()
+    if _telemetry_flusher is not None:
+        _telemetry_flusher.cancel()
+        _telemetry_flusher = None
+    events = _drain_telemetry_queue(_telemetry_queue.qsize())
+    if events:
+        try:
+            await asyncio.wait_for(_post_telemetry(events), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+def _remember_demo_key(demo_key: str, age: float = 0.0) -> str:
+    """Keep a demo key in memory until it is DEMO_KEY_TTL_SECONDS old."""
+    global _demo_key_cache, _demo_key_expires_at
+    _demo_key_cache = demo_key
+    _demo_key_expires_at = time.monotonic() + DEMO_KEY_TTL_SECONDS - age
+    return demo_key
+
+def _cached_demo_key() -> Optional[str]:
+    """Return the in-memory demo key, or None if there is none or it has expired."""
+    if _demo_key_cache and time.monotonic() < _demo_key_expires_at:
+        return _demo_key_cache
+    return None
+
+def _with_demo_key_note(result: Any) -> Any:
+    """Tag a successful result as having been paid for with the demo key."""
+    if isinstance(result, dict):
+        result["_sdk_note"] = "Used auto-fetched demo key. Set COINRAILZ_API_KEY env var to use your own credits."
+    return result
+
+async def _get_demo_key() -> Optional[str]:
+    """
+    Get a demo API key with $1 trial credits.
+    
+    The key is looked up in memory, then in ~/.coinrailz/demo_key, and only
+    fetched from the API as a last resort; either copy is only used until it
+    is DEMO_KEY_TTL_SECONDS old.
+    A failed fetch is remembered for DEMO_KEY_RETRY_COOLDOWN_SECONDS so an
+    outage doesn't cost an extra request on every call. Concurrent callers
+    share a single fetch, so an install is only issued one key.
+    """
+    demo_key = _cached_demo_key()
+    if demo_key:
+        return demo_key
+    
+    key_file = Path.home() / ".coinrailz" / "demo_key"
+    try:
+        age = time.time() - key_file.stat().st_mtime
+        if age < DEMO_KEY_TTL_SECONDS:
+            cached_key = key_file.read_text().strip()
+            if cached_key:
+                return _remember_demo_key(cached_key, age)
+    except OSError:
+        pass
+    
+    _check_event_loop()
+    async with _demo_key_lock:
+        # Another call may have fetched (or failed to fetch) the key while
+        # this one was waiting for the lock.
+        demo_key = _cached_demo_key()
+        if demo_key:
+            return demo_key
+        if time.monotonic() < _demo_key_failed_until:
+            logger.debug("Skipping demo key fetch; last attempt failed less than %ss ago",
+                         DEMO_KEY_RETRY_COOLDOWN_SECONDS)
+            return None
+        return await _fetch_demo_key()
+
+def _write_private_file(path: Path, text: str) -> None:
+    """Write a credential file that is never readable by other users, even briefly."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        tmp_path.unlink()
+    except FileNotFoundError:
+        pass
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, "w") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+async def _fetch_demo_key() -> Optional[str]:
+    """Request a new demo key from the API and store it in ~/.coinrailz/demo_key."""
+    global _demo_key_failed_until
+    try:
+        install_id = _get_install_id()
+        client = await _get_client()
+        response = await client.post(
+            "/api/sdk/demo-key",
+            json={
+                "installId": install_id,
+                "sdkType": "python-mcp"
+            },
+            timeout=10.0
+        )
+        if response.status_code == 200:
+            demo_key = response.json().get("api_key")
+            if demo_key:
+                try:
+                    _write_private_file(_get_config_dir() / "demo_key", demo_key)
+                except OSError:
+                    pass
+                _demo_key_failed_until = 0.0
+                return _remember_demo_key(demo_key)
+        logger.debug("Demo key request returned HTTP %s", response.status_code)
+    except Exception as e:
+        logger.debug("Demo key request failed: %s", e)
+    _demo_key_failed_until = time.monotonic() + DEMO_KEY_RETRY_COOLDOWN_SECONDS
     return None
 
-mcp = FastMCP("coinrailz")
+@asynccontextmanager
+async def _lifespan(server: FastMCP):
+    """
+    Server lifespan hook: warm per-install state.
+    
+    The lifespan is entered once per session (once per request in stateless
+    streamable HTTP), so the shared client and telemetry flusher are left
+    open across sessions and only shut down when main() exits.
+    """
+    try:
+        _get_install_id()
+    except OSError:
+        pass
+    yield
+
+mcp = FastMCP("coinrailz", lifespan=_lifespan)
+
+def _register_tool(fn):
+    """
+    Register fn as an MCP tool and return it unchanged.
+    
+    The registered wrapper hands FastMCP a finished CallToolResult (the result
+    as structured content, plus its JSON text from _tool_text) so the SDK does
+    not re-encode every result with a 2-space indent.
+    """
+    async def call(**kwargs) -> Annotated[CallToolResult, dict[str, Any]]:
+        result = await fn(**kwargs)
+        return CallToolResult(
+            content=[TextContent(type="text", text=_tool_text(result))],
+            structuredContent=result,
+        )
+    
+    # Take fn's name and docs, but not its return annotation: FastMCP derives
+    # the output schema from the dict[str, Any] inside Annotated.
+    functools.update_wrapper(call, fn, assigned=("__module__", "__name__", "__qualname__", "__doc__"))
+    call.__signature__ = inspect.signature(fn).replace(
+        return_annotation=call.__annotations__["return"]
+    )
+    mcp.tool()(call)
+    return fn
+
+def _cache_key(service: str, payload: Optional[dict]) -> str:
+    """Build the response cache key for a service call."""
+    digest = hashlib.blake2b(_canonical_json(payload or {}), digest_size=16).hexdigest()
+    return f"{service}:{digest}"
+
+def _cache_get(key: str, stale_seconds: float = 0) -> tuple[Any, bool]:
+    """
+    Look up a cached result.
+    
+    Returns (result, is_fresh). Expired results are still returned, marked
+    stale, for up to stale_seconds past expiry; (None, False) otherwise.
+    """
+    entry = _cache.get(key)
+    if entry is None:
+        return None, False
+    expires_at, result = entry
+    now = time.monotonic()
+    if expires_at + stale_seconds <= now:
+        del _cache[key]
+        return None, False
+    _cache.move_to_end(key)
+    return result, expires_at > now
+
+def _cache_put(key: str, ttl: float, result: Any) -> None:
+    """Store a result, evicting the least recently used entries when full."""
+    _cache[key] = (time.monotonic() + ttl, result)
+    _cache.move_to_end(key)
+    while len(_cache) > CACHE_MAX_ENTRIES:
+        _cache.popitem(last=False)
 
 async def call_coinrailz_service(
     service: str, 
@@ -123,82 +579,434 @@ async def call_coinrailz_service(
     
     Features:
     - Automatically tries free tier services without API key
-    - Auto-fetches demo key if service requires payment
+    - Auto-fetches (and caches) a demo key before calling paid services
+    - Reuses recent results of services listed in CACHE_TTL_SECONDS
+    - Coalesces identical concurrent calls into a single HTTP request
+    - Optionally batches different calls made close together (COINRAILZ_BATCH_WINDOW_MS)
     - Sends anonymous telemetry to improve SDK experience
     """
-    global COINRAILZ_API_KEY
-    
-    await _send_telemetry("usage")
+    _check_event_loop()
+    _send_telemetry("usage")
+    
+    if service in NON_IDEMPOTENT_SERVICES:
+        return await _request_service(service, payload, method)
+    
+    key = _cache_key(service, payload)
+    ttl = 0 if CACHE_DISABLED else CACHE_TTL_SECONDS.get(service, 0)
+    if ttl:
+        cached, is_fresh = _cache_get(key, CACHE_STALE_SECONDS.get(service, 0))
+        if cached is not None:
+            if not is_fresh and key not in _inflight:
+                _start_shared_request(key, service, payload, method, ttl)
+            return cached
+    
+    task = _inflight.get(key)
+    if task is None:
+        task = _start_shared_request(key, service, payload, method, ttl)
+    # Every caller, the first included, waits through a shield so that one
+    # cancelled tool call does not abort the request the others are sharing.
+    return await asyncio.shield(task)
+
+def _start_shared_request(
+    key: str,
+    service: str,
+    payload: Optional[dict],
+    method: str,
+    ttl: float
+) -> asyncio.Task:
+    """
+    Start the request that concurrent identical calls share.
+    
+    The request runs in its own task, registered in _inflight under key until
+    it finishes, so it completes (and fills the cache) even if every caller
+    waiting on it is cancelled. Stale cache entries are refreshed the same way.
+    """
+    task = asyncio.create_task(_fetch_and_cache(key, service, payload, method, ttl))
+    _inflight[key] = task
+    
+    def finished(task: asyncio.Task) -> None:
+        if _inflight.get(key) is task:
+            del _inflight[key]
+        if not task.cancelled() and task.exception() is not None:
+            # Retrieved here so a request nobody is waiting on any more
+            # (e.g. a background refresh) does not warn when it fails.
+            logger.debug("Request to %s failed: %s", service, task.exception())
+    
+    task.add_done_callback(finished)
+    return task
+
+async def _fetch_and_cache(
+    key: str,
+    service: str,
+    payload: Optional[dict],
+    method: str,
+    ttl: float
+) -> dict:
+    """Make a shared service request and cache a successful result."""
+    # Without a user key a batch is sent with the demo key, which free-tier
+    # calls must not use up, so those are sent on their own.
+    if (REQUEST_BATCH_WINDOW_MS and method == "POST" and service not in ASYNC_JOB_SERVICES
+            and (COINRAILZ_API_KEY or service not in FREE_TIER_SERVICES)):
+        result = await _request_coalesced(service, payload)
+    else:
+        result = await _request_service(service, payload, method)
+    if ttl and not (isinstance(result, dict) and "error" in result):
+        _cache_put(key, ttl, result)
+    return result
+
+def _retry_delay(response: Optional[httpx.Response], attempt: int) -> Optional[float]:
+    """Seconds to wait before the next attempt, or None if it should not be retried."""
+    if response is not None and "retry-after" in response.headers:
+        try:
+            delay = float(response.headers["retry-after"])
+        except ValueError:
+            delay = None
+        if delay is not None:
+            return max(delay, 0.0) if delay <= RETRY_AFTER_MAX_SECONDS else None
+    return min(2 ** attempt, RETRY_BACKOFF_MAX_SECONDS) + random.random() * 0.25
+
+def _is_marked_retryable(response: httpx.Response) -> bool:
+    """Check whether an error body explicitly says the request may be retried."""
+    try:
+        body = _loads(response.content)
+    except Exception:
+        return False
+    return isinstance(body, dict) and body.get("retryable") is True
+
+async def _send(
+    client: httpx.AsyncClient,
+    method: str,
+    url: str,
+    payload: Optional[dict],
+    headers: dict,
+    idempotent: bool = True,
+    timeout: httpx.Timeout = DEFAULT_TIMEOUT
+) -> httpx.Response:
+    """
+    Issue one HTTP request, bounded by the MAX_CONCURRENCY limit.
+    
+    429/5xx responses and transport errors are retried up to MAX_ATTEMPTS
+    times. Non-idempotent calls are only retried when the request never
+    reached the server, the server turned it away unprocessed (429/503) or
+    the error body says "retryable": true. Read timeouts are not retried.
+    """
+    if method == "POST":
+        # Encode the body once, not on every attempt.
+        body = _dumps(payload or {})
+        headers = {**headers, "Content-Type": "application/json"}
+    
+    for attempt in range(MAX_ATTEMPTS):
+        is_last_attempt = attempt == MAX_ATTEMPTS - 1
+        response = None
+        try:
+            async with _request_semaphore:
+                if method == "POST":
+                    response = await client.post(
+                        url, content=body, headers=headers, timeout=timeout
+                    )
+                else:
+                    response = await client.get(url, headers=headers, timeout=timeout)
+        except httpx.ReadTimeout:
+            raise
+        except httpx.TransportError as e:
+            if is_last_attempt or not (idempotent or isinstance(e, _NOT_SENT_ERRORS)):
+                raise
+        else:
+            if (is_last_attempt
+                    or response.status_code not in RETRY_STATUS_CODES
+                    or not (idempotent
+                            or response.status_code in _NOT_PROCESSED_STATUS_CODES
+                            or _is_marked_retryable(response))):
+                return response
+        
+        delay = _retry_delay(response, attempt)
+        if delay is None:
+            return response
+        await asyncio.sleep(delay)
+
+def _decode_success(response: httpx.Response) -> dict:
+    """Decode a successful response, adding polling hints to async job handles."""
+    result = _loads(response.content)
+    if not isinstance(result, dict):
+        # Tools always return a JSON object; wrap bare arrays/scalars.
+        return {"result": result}
+    if response.status_code == 202 and "jobId" in result:
+        result.setdefault("poll_with", "poll_coinrailz_job")
+        result.setdefault("poll_after_seconds", JOB_POLL_AFTER_SECONDS)
+    return result
+
+def _breaker_retry_in(service: str) -> float:
+    """Seconds until a tripped service may be called again, or 0 if it is closed."""
+    entry = _breakers.get(service)
+    if entry is None:
+        return 0
+    return max(entry[1] - time.monotonic(), 0)
+
+def _record_outcome(service: str, failed: bool) -> None:
+    """Update a service's circuit breaker after a request."""
+    if not failed:
+        _breakers.pop(service, None)
+        return
+    failures = _breakers.get(service, (0, 0.0))[0] + 1
+    open_until = 0.0
+    if failures >= BREAKER_FAILURE_THRESHOLD:
+        open_until = time.monotonic() + BREAKER_COOLDOWN_SECONDS
+        logger.debug("%s failed %d times in a row; pausing calls for %ss",
+                     service, failures, BREAKER_COOLDOWN_SECONDS)
+    _breakers[service] = (failures, open_until)
+
+async def _request_service(service: str, payload: Optional[dict], method: str) -> dict:
+    """Send a single request to a Coin Railz service and decode the result."""
+    # Paths such as jobs/<id> share the breaker and timeout of their endpoint.
+    endpoint = service.partition("/")[0]
+    retry_in = _breaker_retry_in(endpoint)
+    if retry_in:
+        return {
+            "error": "Service temporarily unavailable",
+            "service": endpoint,
+            "message": f"Recent calls to {endpoint} kept failing. Try again in {retry_in:.0f}s."
+        }
     
-    url = f"{COINRAILZ_BASE_URL}/x402/{service}"
+    url = f"/x402/{service}"
     is_free_service = service in FREE_TIER_SERVICES
     
-    headers = {
-        "Content-Type": "application/json",
-        "User-Agent": f"CoinRailz-MCP-Server/{__version__}"
-    }
-    
     api_key = COINRAILZ_API_KEY
-    if api_key:
-        headers["X-API-KEY"] = api_key
+    if not api_key and not is_free_service:
+        api_key = await _get_demo_key() or ""
+    headers = {"X-API-KEY": api_key} if api_key else {}
+    if service in ASYNC_JOB_SERVICES:
+        headers["X-Async"] = "1"
     
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            if method == "POST":
-                response = await client.post(url, json=payload or {}, headers=headers)
-            else:
-                response = await client.get(url, headers=headers)
+    # Paid calls are billed per request, so a POST that may already have
+    # reached the server is only repeated for the free-tier services.
+    idempotent = method == "GET" or is_free_service
+    timeout = SERVICE_TIMEOUTS.get(endpoint, DEFAULT_TIMEOUT)
+    
+    try:
+        client = await _get_client()
+        response = await _send(client, method, url, payload, headers, idempotent, timeout)
+        _record_outcome(endpoint, response.status_code == 429 or response.status_code >= 500)
+        
+        if response.status_code == 402:
+            data = _loads(response.content)
+            price = data.get("accepts", [{}])[0].get("maxAmountRequiredUSD", "Unknown")
             
-            if response.status_code == 402:
-                data = response.json()
-                price = data.get("accepts", [{}])[0].get("maxAmountRequiredUSD", "Unknown")
-                
-                if not api_key:
-                    demo_key = await _get_demo_key()
-                    if demo_key:
-                        headers["X-API-KEY"] = demo_key
-                        if method == "POST":
-                            retry_response = await client.post(url, json=payload or {}, headers=headers)
-                        else:
-                            retry_response = await client.get(url, headers=headers)
-                        
-                        if retry_response.status_code == 200:
-                            result = retry_response.json()
-                            result["_sdk_note"] = f"Used auto-fetched demo key. Set COINRAILZ_API_KEY env var to use your own credits."
-                            return result
-                
-                return {
-                    "error": "Payment required",
-                    "service": service,
-                    "price_usd": price,
-                    "message": f"This service costs ${price}. You need an API key with credits.",
-                    "quick_fix": {
-                        "step_1": "Get FREE demo key: Run any free service first (gas-price-oracle, token-metadata)",
-                        "step_2": "Or buy credits: https://coinrailz.com/credits ($10 minimum)",
-                        "step_3": "Set env var: export COINRAILZ_API_KEY=your_key_here"
-                    },
-                    "free_services": list(FREE_TIER_SERVICES),
-                    "sdk_info": {
-                        "get_demo_key": "POST https://coinrailz.com/api/sdk/demo-key with your install ID",
-                        "credits_page": "https://coinrailz.com/credits",
-                        "documentation": "https://coinrailz.com/docs/sdk"
-                    }
-                }
+            # Paid services already tried the demo key before the request, so
+            # only a free-tier call that has used up its free quota gets here.
+            if not api_key and is_free_service:
+                demo_key = await _get_demo_key()
+                if demo_key:
+                    headers["X-API-KEY"] = demo_key
+                    retry_response = await _send(
+                        client, method, url, payload, headers, idempotent, timeout
+                    )
+                    
+                    if retry_response.status_code in (200, 202):
+                        return _with_demo_key_note(_decode_success(retry_response))
             
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            return {"error": f"HTTP {e.response.status_code}", "message": str(e)}
+            return {
+                "error": "Payment required",
+                "service": service,
+                "price_usd": price,
+                "message": f"This service costs ${price}. You need an API key with credits.",
+                "quick_fix": {
+                    "step_1": "Get FREE demo key: Run any free service first (gas-price-oracle, token-metadata)",
+                    "step_2": "Or buy credits: https://coinrailz.com/credits ($10 minimum)",
+                    "step_3": "Set env var: export COINRAILZ_API_KEY=your_key_here"
+                },
+                "free_services": list(FREE_TIER_SERVICES),
+                "sdk_info": {
+                    "get_demo_key": "POST https://coinrailz.com/api/sdk/demo-key with your install ID",
+                    "credits_page": "https://coinrailz.com/credits",
+                    "documentation": "https://coinrailz.com/docs/sdk"
+                }
+            }
+        
+        response.raise_for_status()
+        result = _decode_success(response)
+        if api_key and api_key == _demo_key_cache:
+            result = _with_demo_key_note(result)
+        return result
+    except httpx.HTTPStatusError as e:
+        return {"error": f"HTTP {e.response.status_code}", "message": str(e)}
+    except httpx.TransportError as e:
+        _record_outcome(endpoint, True)
+        return {"error": "Request failed", "message": str(e)}
+    except Exception as e:
+        return {"error": "Request failed", "message": str(e)}
+
+async def _request_coalesced(service: str, payload: Optional[dict]) -> dict:
+    """Queue a service call for the next /x402/batch request and await its result."""
+    global _request_batch_flusher
+    if _breaker_retry_in(service):
+        # Let the per-call path report the open breaker without queuing.
+        return await _request_service(service, payload, "POST")
+    future = asyncio.get_running_loop().create_future()
+    _request_batch_pending.append((service, payload, future))
+    if _request_batch_flusher is None:
+        _request_batch_flusher = asyncio.create_task(_flush_request_batch())
+    elif len(_request_batch_pending) >= REQUEST_BATCH_MAX_SIZE:
+        _request_batch_full.set()
+    return await future
+
+async def _flush_request_batch() -> None:
+    """Wait out the batching window (or a full batch), then send what is queued."""
+    global _request_batch_flusher
+    try:
+        await asyncio.wait_for(_request_batch_full.wait(), REQUEST_BATCH_WINDOW_MS / 1000)
+    except asyncio.TimeoutError:
+        pass
+    pending = _request_batch_pending[:]
+    _request_batch_pending.clear()
+    _request_batch_full.clear()
+    _request_batch_flusher = None
+    await asyncio.gather(*(
+        _send_request_batch(pending[i:i + REQUEST_BATCH_MAX_SIZE])
+        for i in range(0, len(pending), REQUEST_BATCH_MAX_SIZE)
+    ))
+
+async def _send_request_batch(batch: list[tuple[str, Optional[dict], asyncio.Future]]) -> None:
+    """
+    Send queued service calls as one /x402/batch request and resolve their futures.
+    
+    Falls back to one request per call if the batch fails, and stops batching
+    for good if the endpoint is not available (404/405). Each result may carry
+    its HTTP status in an integer "status" field.
+    """
+    global _request_batch_supported
+    results = None
+    if len(batch) > 1 and _request_batch_supported:
+        api_key = COINRAILZ_API_KEY
+        if not api_key and any(service not in FREE_TIER_SERVICES for service, _, _ in batch):
+            api_key = await _get_demo_key() or ""
+        headers = {"X-API-KEY": api_key} if api_key else {}
+        body = [{"service": service, "payload": payload or {}} for service, payload, _ in batch]
+        idempotent = all(service in FREE_TIER_SERVICES for service, _, _ in batch)
+        try:
+            client = await _get_client()
+            response = await _send(client, "POST", "/x402/batch", body, headers, idempotent)
+            if response.status_code in (404, 405):
+                _request_batch_supported = False
+            elif response.status_code == 200:
+                data = _loads(response.content)
+                if isinstance(data, list) and len(data) == len(batch):
+                    results = [r if isinstance(r, dict) else {"result": r} for r in data]
         except Exception as e:
-            return {"error": "Request failed", "message": str(e)}
+            logger.debug("Batch request failed, sending calls individually: %s", e)
+    
+    if results is None:
+        results = await asyncio.gather(*(
+            _request_service(service, payload, "POST") for service, payload, _ in batch
+        ))
+    else:
+        results = await asyncio.gather(*(
+            _settle_batch_item(service, payload, item, api_key)
+            for (service, payload, _), item in zip(batch, results)
+        ))
+    for (_, _, future), result in zip(batch, results):
+        if not future.done():
+            future.set_result(result)
+
+async def _settle_batch_item(service: str, payload: Optional[dict], item: dict, api_key: str) -> dict:
+    """
+    Finish one /x402/batch result the way _request_service finishes a response.
+    
+    Updates the service's circuit breaker, and sends payment-required results
+    back through _request_service for its demo-key retry and error message.
+    """
+    status = item.get("status")
+    if not isinstance(status, int):
+        status = 402 if "accepts" in item else 200
+    if status == 402:
+        return await _request_service(service, payload, "POST")
+    _record_outcome(service, status == 429 or status >= 500)
+    if api_key and api_key == _demo_key_cache:
+        item = _with_demo_key_note(item)
+    return item
+
+def _norm_ticker(symbol: str, max_length: int = TICKER_MAX_LENGTH) -> str:
+    """Validate a ticker or currency pair and return it upper-cased."""
+    if len(symbol) > max_length or not symbol.isascii() or not _TICKER_RE.fullmatch(symbol):
+        raise ValueError(
+            f"Invalid symbol {symbol[:max_length]!r}: expected up to {max_length} "
+            "letters, digits, '.', '-' or '/'"
+        )
+    return symbol.upper()
+
+# Default for required arguments in a _service_tool parameter list.
+_REQUIRED = inspect.Parameter.empty
+
+def _or_default(default: Any):
+    """Argument transform: substitute default for a missing or empty value."""
+    return lambda value: value or default
+
+def _at_most(limit: Any):
+    """Argument transform: clamp a value to an upper limit."""
+    return lambda value: min(value, limit)
+
+def _camel_case(name: str) -> str:
+    """Convert a snake_case argument name to its camelCase payload key."""
+    head, *rest = name.split("_")
+    return head + "".join(part.title() for part in rest)
+
+def _service_tool(
+    name: str,
+    service: str,
+    params: list,
+    doc: str,
+    keys: Optional[dict] = None
+):
+    """
+    Create and register a tool that passes its arguments straight to a service.
+    
+    params lists (name, annotation, default) for each argument, with _REQUIRED
+    as the default of required arguments, optionally followed by a transform
+    applied to the value before it is sent. Arguments are sent under their
+    camelCase name unless renamed in keys. Arguments that default to None are
+    left out of the payload when not given (after any transform).
+    """
+    signature = inspect.Signature(
+        [
+            inspect.Parameter(arg, inspect.Parameter.POSITIONAL_OR_KEYWORD, default=default, annotation=annotation)
+            for arg, annotation, default, *_ in params
+        ],
+        return_annotation=dict[str, Any],
+    )
+    # Service names and generated payload keys are used as dict keys on every
+    # call but, unlike identifier-like literals, are not interned automatically.
+    service = sys.intern(service)
+    # (argument, payload key, transform, omit-if-unset) for each parameter.
+    fields = [
+        (arg, sys.intern((keys or {}).get(arg) or _camel_case(arg)), transform[0] if transform else None, default is None)
+        for arg, _, default, *transform in params
+    ]
+    
+    async def tool(*args, **kwargs) -> dict[str, Any]:
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        payload = {}
+        for arg, key, transform, optional in fields:
+            value = bound.arguments[arg]
+            if transform is not None:
+                value = transform(value)
+            if not (optional and value in (None, "")):
+                payload[key] = value
+        result = await call_coinrailz_service(service, payload)
+        return result
+    
+    tool.__name__ = tool.__qualname__ = name
+    tool.__doc__ = doc
+    tool.__signature__ = signature
+    return _register_tool(tool)
 
 
 # =============================================================================
 # CATEGORY 1: DISCOVERY & TESTING (1 service)
 # =============================================================================
 
-@mcp.tool()
-async def ping_coinrailz(message: str = "Hello from Claude") -> str:
+ping_coinrailz = _service_tool(
+    "ping_coinrailz", "ping",
+    [("message", str, "Hello from Claude")],
     """
     Test connectivity to Coin Railz x402 payment infrastructure.
     
@@ -209,17 +1017,17 @@ async def ping_coinrailz(message: str = "Hello from Claude") -> str:
         Platform status, version, and available services count.
     
     Price: $0.25
-    """
-    result = await call_coinrailz_service("ping", {"message": message})
-    return json.dumps(result, indent=2)
+    """,
+)
 
 
 # =============================================================================
 # CATEGORY 2: TRADING INTELLIGENCE (14 services)
 # =============================================================================
 
-@mcp.tool()
-async def get_gas_prices(chains: List[str] = None) -> str:
+get_gas_prices = _service_tool(
+    "get_gas_prices", "gas-price-oracle",
+    [("chains", List[str], None, _or_default(_DEFAULT_GAS_CHAINS))],
     """
     Get real-time gas prices across multiple blockchain networks.
     
@@ -231,13 +1039,12 @@ async def get_gas_prices(chains: List[str] = None) -> str:
         Gas prices in gwei with USD cost estimates for each chain.
     
     Price: $0.10 (FIRST CALL FREE for new users!)
-    """
-    payload = {"chains": chains or ["ethereum", "base", "polygon", "arbitrum", "optimism"]}
-    result = await call_coinrailz_service("gas-price-oracle", payload)
-    return json.dumps(result, indent=2)
+    """,
+)
 
-@mcp.tool()
-async def get_token_metadata(token_address: str, chain: str = "ethereum") -> str:
+get_token_metadata = _service_tool(
+    "get_token_metadata", "token-metadata",
+    [("token_address", str, _REQUIRED), ("chain", str, "ethereum")],
     """
     Get metadata for any ERC-20 token including name, symbol, decimals, and total supply.
     
@@ -249,13 +1056,12 @@ async def get_token_metadata(token_address: str, chain: str = "ethereum") -> str
         Token metadata including name, symbol, decimals, total supply.
     
     Price: $0.10 (FIRST CALL FREE for new users!)
-    """
-    payload = {"tokenAddress": token_address, "chain": chain}
-    result = await call_coinrailz_service("token-metadata", payload)
-    return json.dumps(result, indent=2)
+    """,
+)
 
-@mcp.tool()
-async def get_token_price(token_address: str, chain: str = "ethereum") -> str:
+get_token_price = _service_tool(
+    "get_token_price", "token-price",
+    [("token_address", str, _REQUIRED), ("chain", str, "ethereum")],
     """
     Get real-time token price from multiple DEX sources.
     
@@ -267,13 +1073,12 @@ async def get_token_price(token_address: str, chain: str = "ethereum") -> str:
         Token price in USD with source information.
     
     Price: $0.25
-    """
-    payload = {"tokenAddress": token_address, "chain": chain}
-    result = await call_coinrailz_service("token-price", payload)
-    return json.dumps(result, indent=2)
+    """,
+)
 
-@mcp.tool()
-async def get_token_sentiment(token_address: str, chain: str = "ethereum") -> str:
+get_token_sentiment = _service_tool(
+    "get_token_sentiment", "token-sentiment",
+    [("token_address", str, _REQUIRED), ("chain", str, "ethereum")],
     """
     Get AI-powered social sentiment analysis for a token.
     
@@ -285,13 +1090,12 @@ async def get_token_sentiment(token_address: str, chain: str = "ethereum") -> st
         Sentiment score, social volume, and trending topics related to the token.
     
     Price: $0.25
-    """
-    payload = {"tokenAddress": token_address, "chain": chain}
-    result = await call_coinrailz_service("token-sentiment", payload)
-    return json.dumps(result, indent=2)
+    """,
+)
 
-@mcp.tool()
-async def get_trending_tokens(chain: str = "ethereum", limit: int = 10) -> str:
+get_trending_tokens = _service_tool(
+    "get_trending_tokens", "trending-tokens",
+    [("chain", str, "ethereum"), ("limit", int, 10, _at_most(50))],
     """
     Get trending tokens across DeFi platforms.
     
@@ -303,13 +1107,15 @@ async def get_trending_tokens(chain: str = "ethereum", limit: int = 10) -> str:
         List of trending tokens with volume, price change, and social metrics.
     
     Price: $0.50
-    """
-    payload = {"chain": chain, "limit": min(limit, 50)}
-    result = await call_coinrailz_service("trending-tokens", payload)
-    return json.dumps(result, indent=2)
+    """,
+)
 
-@mcp.tool()
-async def get_whale_alerts(chains: List[str] = None, min_value_usd: int = 100000) -> str:
+get_whale_alerts = _service_tool(
+    "get_whale_alerts", "whale-alerts",
+    [
+        ("chains", List[str], None, _or_default(_DEFAULT_WHALE_CHAINS)),
+        ("min_value_usd", int, 100000),
+    ],
     """
     Get real-time whale transaction alerts across chains.
     
@@ -321,16 +1127,12 @@ async def get_whale_alerts(chains: List[str] = None, min_value_usd: int = 100000
         Recent large transactions with sender, receiver, and token details.
     
     Price: $0.35
-    """
-    payload = {
-        "chains": chains or ["ethereum", "base", "polygon"],
-        "minValueUsd": min_value_usd
-    }
-    result = await call_coinrailz_service("whale-alerts", payload)
-    return json.dumps(result, indent=2)
+    """,
+)
 
-@mcp.tool()
-async def get_dex_liquidity(token_address: str, chain: str = "ethereum") -> str:
+get_dex_liquidity = _service_tool(
+    "get_dex_liquidity", "dex-liquidity",
+    [("token_address", str, _REQUIRED), ("chain", str, "ethereum")],
     """
     Get DEX liquidity analysis for a token across major exchanges.
     
@@ -342,13 +1144,12 @@ async def get_dex_liquidity(token_address: str, chain: str = "ethereum") -> str:
         Liquidity depth, top pools, and slippage estimates.
     
     Price: $0.20
-    """
-    payload = {"tokenAddress": token_address, "chain": chain}
-    result = await call_coinrailz_service("dex-liquidity", payload)
-    return json.dumps(result, indent=2)
+    """,
+)
 
-@mcp.tool()
-async def get_trade_signals(token: str = None, chain: str = "ethereum") -> str:
+get_trade_signals = _service_tool(
+    "get_trade_signals", "trade-signals",
+    [("token", str, None), ("chain", str, "ethereum")],
     """
     Get AI-powered trading signals and market recommendations.
     
@@ -360,13 +1161,12 @@ async def get_trade_signals(token: str = None, chain: str = "ethereum") -> str:
         Trading signals with entry/exit recommendations and confidence scores.
     
     Price: $0.75
-    """
-    payload = {"token": token, "chain": chain} if token else {"chain": chain}
-    result = await call_coinrailz_service("trade-signals", payload)
-    return json.dumps(result, indent=2)
+    """,
+)
 
-@mcp.tool()
-async def get_trading_signal(symbol: str, timeframe: str = "1h") -> str:
+get_trading_signal = _service_tool(
+    "get_trading_signal", "trading-signal",
+    [("symbol", str, _REQUIRED), ("timeframe", str, "1h")],
     """
     Get trading signal for a specific symbol and timeframe.
     
@@ -378,13 +1178,15 @@ async def get_trading_signal(symbol: str, timeframe: str = "1h") -> str:
         Buy/sell signal with indicators, confidence, and target prices.
     
     Price: $1.00
-    """
-    payload = {"symbol": symbol, "timeframe": timeframe}
-    result = await call_coinrailz_service("trading-signal", payload)
-    return json.dumps(result, indent=2)
+    """,
+)
 
-@mcp.tool()
-async def get_sentiment_analysis(query: str, sources: List[str] = None) -> str:
+get_sentiment_analysis = _service_tool(
+    "get_sentiment_analysis", "sentiment-analysis",
+    [
+        ("query", str, _REQUIRED),
+        ("sources", List[str], None, _or_default(_DEFAULT_SENTIMENT_SOURCES)),
+    ],
     """
     Get AI-powered sentiment analysis for crypto topics.
     
@@ -396,16 +1198,15 @@ async def get_sentiment_analysis(query: str, sources: List[str] = None) -> str:
         Sentiment score, volume trends, and key narratives.
     
     Price: $0.50
-    """
-    payload = {
-        "query": query,
-        "sources": sources or ["twitter", "reddit", "news"]
-    }
-    result = await call_coinrailz_service("sentiment-analysis", payload)
-    return json.dumps(result, indent=2)
+    """,
+)
 
-@mcp.tool()
-async def get_arbitrage_opportunities(chains: List[str] = None, min_profit_pct: float = 0.5) -> str:
+get_arbitrage_opportunities = _service_tool(
+    "get_arbitrage_opportunities", "arbitrage-scanner",
+    [
+        ("chains", List[str], None, _or_default(_DEFAULT_ARB_CHAINS)),
+        ("min_profit_pct", float, 0.5),
+    ],
     """
     Scan for cross-chain arbitrage opportunities.
     
@@ -417,16 +1218,12 @@ async def get_arbitrage_opportunities(chains: List[str] = None, min_profit_pct:
         List of arbitrage opportunities with routes and expected profit.
     
     Price: $1.25
-    """
-    payload = {
-        "chains": chains or ["ethereum", "base", "polygon", "arbitrum"],
-        "minProfitPct": min_profit_pct
-    }
-    result = await call_coinrailz_service("arbitrage-scanner", payload)
-    return json.dumps(result, indent=2)
+    """,
+)
 
-@mcp.tool()
-async def get_correlation_matrix(tokens: List[str], timeframe: str = "7d") -> str:
+get_correlation_matrix = _service_tool(
+    "get_correlation_matrix", "correlation-matrix",
+    [("tokens", List[str], _REQUIRED), ("timeframe", str, "7d")],
     """
     Get correlation matrix between multiple tokens.
     
@@ -438,13 +1235,12 @@ async def get_correlation_matrix(tokens: List[str], timeframe: str = "7d") -> st
         Correlation coefficients between all token pairs.
     
     Price: $0.75
-    """
-    payload = {"tokens": tokens, "timeframe": timeframe}
-    result = await call_coinrailz_service("correlation-matrix", payload)
-    return json.dumps(result, indent=2)
+    """,
+)
 
-@mcp.tool()
-async def get_risk_metrics(token_address: str, chain: str = "ethereum") -> str:
+get_risk_metrics = _service_tool(
+    "get_risk_metrics", "risk-metrics",
+    [("token_address", str, _REQUIRED), ("chain", str, "ethereum")],
     """
     Get comprehensive risk metrics for a token.
     
@@ -456,13 +1252,12 @@ async def get_risk_metrics(token_address: str, chain: str = "ethereum") -> str:
         Volatility, VaR, max drawdown, and other risk metrics.
     
     Price: $1.00
-    """
-    payload = {"tokenAddress": token_address, "chain": chain}
-    result = await call_coinrailz_service("risk-metrics", payload)
-    return json.dumps(result, indent=2)
+    """,
+)
 
-@mcp.tool()
-async def get_batch_quote(tokens: List[str], chain: str = "ethereum") -> str:
+get_batch_quote = _service_tool(
+    "get_batch_quote", "batch-quote",
+    [("tokens", List[str], _REQUIRED), ("chain", str, "ethereum")],
     """
     Get quotes for multiple tokens in a single request.
     
@@ -474,18 +1269,21 @@ async def get_batch_quote(tokens: List[str], chain: str = "ethereum") -> str:
         Prices and metadata for all requested tokens.
     
     Price: $0.40
-    """
-    payload = {"tokens": tokens, "chain": chain}
-    result = await call_coinrailz_service("batch-quote", payload)
-    return json.dumps(result, indent=2)
+    """,
+)
 
 
 # =============================================================================
 # CATEGORY 3: EXECUTION & INFRASTRUCTURE (4 services)
 # =============================================================================
 
-@mcp.tool()
-async def get_multi_chain_balance(wallet_address: str, chains: List[str] = None, include_tokens: bool = True) -> str:
+get_multi_chain_balance = _service_tool(
+    "get_multi_chain_balance", "multi-chain-balance",
+    [
+        ("wallet_address", str, _REQUIRED),
+        ("chains", List[str], None, _or_default(_DEFAULT_BALANCE_CHAINS)),
+        ("include_tokens", bool, True),
+    ],
     """
     Get multi-chain wallet balance across 7+ EVM networks.
     
@@ -498,23 +1296,18 @@ async def get_multi_chain_balance(wallet_address: str, chains: List[str] = None,
         Wallet balances for native tokens and ERC-20 tokens across all specified chains.
     
     Price: $0.50
-    """
-    payload = {
-        "walletAddress": wallet_address,
-        "chains": chains or ["ethereum", "base", "polygon", "bsc", "arbitrum", "optimism"],
-        "includeTokens": include_tokens
-    }
-    result = await call_coinrailz_service("multi-chain-balance", payload)
-    return json.dumps(result, indent=2)
-
-@mcp.tool()
-async def build_transaction(
-    from_address: str,
-    to_address: str,
-    value: str,
-    chain: str = "ethereum",
-    token_address: str = None
-) -> str:
+    """,
+)
+
+build_transaction = _service_tool(
+    "build_transaction", "transaction-builder",
+    [
+        ("from_address", str, _REQUIRED),
+        ("to_address", str, _REQUIRED),
+        ("value", str, _REQUIRED),
+        ("chain", str, "ethereum"),
+        ("token_address", str, None),
+    ],
     """
     Build a transaction object ready for signing.
     
@@ -529,20 +1322,17 @@ async def build_transaction(
         Unsigned transaction object with gas estimates.
     
     Price: $0.30
-    """
-    payload = {
-        "from": from_address,
-        "to": to_address,
-        "value": value,
-        "chain": chain
-    }
-    if token_address:
-        payload["tokenAddress"] = token_address
-    result = await call_coinrailz_service("transaction-builder", payload)
-    return json.dumps(result, indent=2)
-
-@mcp.tool()
-async def manage_approvals(wallet_address: str, chain: str = "ethereum", action: str = "list") -> str:
+    """,
+    keys={"from_address": "from", "to_address": "to"},
+)
+
+manage_approvals = _service_tool(
+    "manage_approvals", "approval-manager",
+    [
+        ("wallet_address", str, _REQUIRED),
+        ("chain", str, "ethereum"),
+        ("action", str, "list"),
+    ],
     """
     Manage token approvals for a wallet.
     
@@ -555,23 +1345,18 @@ async def manage_approvals(wallet_address: str, chain: str = "ethereum", action:
         List of token approvals with risk assessment.
     
     Price: $0.20
-    """
-    payload = {
-        "walletAddress": wallet_address,
-        "chain": chain,
-        "action": action
-    }
-    result = await call_coinrailz_service("approval-manager", payload)
-    return json.dumps(result, indent=2)
-
-@mcp.tool()
-async def bridge_tokens(
-    from_chain: str,
-    to_chain: str,
-    token_address: str,
-    amount: str,
-    recipient: str = None
-) -> str:
+    """,
+)
+
+bridge_tokens = _service_tool(
+    "bridge_tokens", "seamless-chain-bridge",
+    [
+        ("from_chain", str, _REQUIRED),
+        ("to_chain", str, _REQUIRED),
+        ("token_address", str, _REQUIRED),
+        ("amount", str, _REQUIRED),
+        ("recipient", str, None),
+    ],
     """
     Get bridge quote and route for cross-chain token transfer.
     
@@ -586,25 +1371,17 @@ async def bridge_tokens(
         Bridge route, fees, and estimated time.
     
     Price: $2.00
-    """
-    payload = {
-        "fromChain": from_chain,
-        "toChain": to_chain,
-        "tokenAddress": token_address,
-        "amount": amount
-    }
-    if recipient:
-        payload["recipient"] = recipient
-    result = await call_coinrailz_service("seamless-chain-bridge", payload)
-    return json.dumps(result, indent=2)
+    """,
+)
 
 
 # =============================================================================
 # CATEGORY 4: PREMIUM SERVICES (4 services)
 # =============================================================================
 
-@mcp.tool()
-async def scan_smart_contract(contract_address: str, chain: str = "ethereum") -> str:
+scan_smart_contract = _service_tool(
+    "scan_smart_contract", "contract-scan",
+    [("contract_address", str, _REQUIRED), ("chain", str, "ethereum")],
     """
     Perform security analysis on a smart contract.
     
@@ -614,15 +1391,15 @@ async def scan_smart_contract(contract_address: str, chain: str = "ethereum") ->
     
     Returns:
         Security analysis including vulnerabilities, rug pull risk, and audit score.
+        May instead return a jobId to fetch later with poll_coinrailz_job.
     
     Price: $1.00
-    """
-    payload = {"contractAddress": contract_address, "chain": chain}
-    result = await call_coinrailz_service("contract-scan", payload)
-    return json.dumps(result, indent=2)
+    """,
+)
 
-@mcp.tool()
-async def get_wallet_risk_score(wallet_address: str, chain: str = "ethereum") -> str:
+get_wallet_risk_score = _service_tool(
+    "get_wallet_risk_score", "wallet-risk",
+    [("wallet_address", str, _REQUIRED), ("chain", str, "ethereum")],
     """
     Get risk analysis and security scoring for any wallet address.
     
@@ -634,13 +1411,15 @@ async def get_wallet_risk_score(wallet_address: str, chain: str = "ethereum") ->
         Risk score, transaction patterns, and security recommendations.
     
     Price: $0.50
-    """
-    payload = {"walletAddress": wallet_address, "chain": chain}
-    result = await call_coinrailz_service("wallet-risk", payload)
-    return json.dumps(result, indent=2)
+    """,
+)
 
-@mcp.tool()
-async def track_portfolio(wallet_address: str, chains: List[str] = None) -> str:
+track_portfolio = _service_tool(
+    "track_portfolio", "portfolio-tracker",
+    [
+        ("wallet_address", str, _REQUIRED),
+        ("chains", List[str], None, _or_default(_DEFAULT_PORTFOLIO_CHAINS)),
+    ],
     """
     Get comprehensive portfolio tracking and analytics.
     
@@ -652,16 +1431,15 @@ async def track_portfolio(wallet_address: str, chains: List[str] = None) -> str:
         Portfolio value, allocation, P&L, and historical performance.
     
     Price: $0.50
-    """
-    payload = {
-        "walletAddress": wallet_address,
-        "chains": chains or ["ethereum", "base", "polygon", "arbitrum"]
-    }
-    result = await call_coinrailz_service("portfolio-tracker", payload)
-    return json.dumps(result, indent=2)
+    """,
+)
 
-@mcp.tool()
-async def optimize_portfolio(holdings: List[dict], risk_tolerance: str = "medium") -> str:
+optimize_portfolio = _service_tool(
+    "optimize_portfolio", "portfolio-optimization",
+    [
+        ("holdings", List[dict], _REQUIRED),
+        ("risk_tolerance", str, "medium"),
+    ],
     """
     Get AI-powered portfolio optimization recommendations.
     
@@ -671,23 +1449,20 @@ async def optimize_portfolio(holdings: List[dict], risk_tolerance: str = "medium
     
     Returns:
         Rebalancing recommendations and optimal allocation.
+        May instead return a jobId to fetch later with poll_coinrailz_job.
     
     Price: $2.00
-    """
-    payload = {
-        "holdings": holdings,
-        "riskTolerance": risk_tolerance
-    }
-    result = await call_coinrailz_service("portfolio-optimization", payload)
-    return json.dumps(result, indent=2)
+    """,
+)
 
 
 # =============================================================================
 # CATEGORY 5: REAL ESTATE (3 services)
 # =============================================================================
 
-@mcp.tool()
-async def get_property_valuation(address: str = None, property_id: str = None) -> str:
+get_property_valuation = _service_tool(
+    "get_property_valuation", "property-valuation",
+    [("address", str, None), ("property_id", str, None)],
     """
     Get AI-powered property valuation estimate.
     
@@ -697,19 +1472,14 @@ async def get_property_valuation(address: str = None, property_id: str = None) -
     
     Returns:
         Estimated value, comparable sales, and market trends.
+        May instead return a jobId to fetch later with poll_coinrailz_job.
     
     Price: $0.75
-    """
-    payload = {}
-    if address:
-        payload["address"] = address
-    if property_id:
-        payload["propertyId"] = property_id
-    result = await call_coinrailz_service("property-valuation", payload)
-    return json.dumps(result, indent=2)
+    """,
+)
 
-@mcp.tool()
-async def analyze_lease(lease_terms: dict) -> str:
+@_register_tool
+async def analyze_lease(lease_terms: dict) -> dict[str, Any]:
     """
     Analyze commercial lease terms and market comparison.
     
@@ -718,14 +1488,16 @@ async def analyze_lease(lease_terms: dict) -> str:
     
     Returns:
         Lease analysis with market comparison and recommendations.
+        May instead return a jobId to fetch later with poll_coinrailz_job.
     
     Price: $1.00
     """
     result = await call_coinrailz_service("lease-analysis", lease_terms)
-    return json.dumps(result, indent=2)
+    return result
 
-@mcp.tool()
-async def track_construction_progress(project_id: str) -> str:
+track_construction_progress = _service_tool(
+    "track_construction_progress", "construction-progress",
+    [("project_id", str, _REQUIRED)],
     """
     Track construction project progress and milestones.
     
@@ -736,18 +1508,17 @@ async def track_construction_progress(project_id: str) -> str:
         Progress updates, timeline, and budget status.
     
     Price: $1.50
-    """
-    payload = {"projectId": project_id}
-    result = await call_coinrailz_service("construction-progress", payload)
-    return json.dumps(result, indent=2)
+    """,
+)
 
 
 # =============================================================================
 # CATEGORY 6: BANKING/FINANCE (3 services)
 # =============================================================================
 
-@mcp.tool()
-async def get_credit_risk_score(entity_id: str, entity_type: str = "individual") -> str:
+get_credit_risk_score = _service_tool(
+    "get_credit_risk_score", "credit-risk-score",
+    [("entity_id", str, _REQUIRED), ("entity_type", str, "individual")],
     """
     Get credit risk assessment for individuals or businesses.
     
@@ -757,15 +1528,14 @@ async def get_credit_risk_score(entity_id: str, entity_type: str = "individual")
     
     Returns:
         Credit score, risk factors, and lending recommendations.
+        May instead return a jobId to fetch later with poll_coinrailz_job.
     
     Price: $1.25
-    """
-    payload = {"entityId": entity_id, "entityType": entity_type}
-    result = await call_coinrailz_service("credit-risk-score", payload)
-    return json.dumps(result, indent=2)
+    """,
+)
 
-@mcp.tool()
-async def detect_fraud(transaction_data: dict) -> str:
+@_register_tool
+async def detect_fraud(transaction_data: dict) -> dict[str, Any]:
     """
     AI-powered fraud detection for transactions.
     
@@ -778,10 +1548,11 @@ async def detect_fraud(transaction_data: dict) -> str:
     Price: $0.75
     """
     result = await call_coinrailz_service("fraud-detection", transaction_data)
-    return json.dumps(result, indent=2)
+    return result
 
-@mcp.tool()
-async def run_compliance_check(entity_id: str, check_type: str = "aml") -> str:
+run_compliance_check = _service_tool(
+    "run_compliance_check", "compliance-check",
+    [("entity_id", str, _REQUIRED), ("check_type", str, "aml")],
     """
     Run AML/KYC compliance checks.
     
@@ -793,18 +1564,17 @@ async def run_compliance_check(entity_id: str, check_type: str = "aml") -> str:
         Compliance status, flags, and required actions.
     
     Price: $1.75
-    """
-    payload = {"entityId": entity_id, "checkType": check_type}
-    result = await call_coinrailz_service("compliance-check", payload)
-    return json.dumps(result, indent=2)
+    """,
+)
 
 
 # =============================================================================
 # CATEGORY 7: POLYMARKET PREDICTION MARKETS (4 services)
 # =============================================================================
 
-@mcp.tool()
-async def get_polymarket_events(category: str = None, limit: int = 20) -> str:
+get_polymarket_events = _service_tool(
+    "get_polymarket_events", "polymarket-events",
+    [("category", str, None), ("limit", int, 20)],
     """
     Get active Polymarket prediction market events.
     
@@ -816,15 +1586,12 @@ async def get_polymarket_events(category: str = None, limit: int = 20) -> str:
         List of active prediction markets with current odds.
     
     Price: $0.25
-    """
-    payload = {"limit": limit}
-    if category:
-        payload["category"] = category
-    result = await call_coinrailz_service("polymarket-events", payload)
-    return json.dumps(result, indent=2)
+    """,
+)
 
-@mcp.tool()
-async def get_polymarket_odds(event_id: str) -> str:
+get_polymarket_odds = _service_tool(
+    "get_polymarket_odds", "polymarket-odds",
+    [("event_id", str, _REQUIRED)],
     """
     Get current odds for a specific Polymarket event.
     
@@ -835,13 +1602,12 @@ async def get_polymarket_odds(event_id: str) -> str:
         Current odds, volume, and price history.
     
     Price: $0.50
-    """
-    payload = {"eventId": event_id}
-    result = await call_coinrailz_service("polymarket-odds", payload)
-    return json.dumps(result, indent=2)
+    """,
+)
 
-@mcp.tool()
-async def search_polymarket(query: str, limit: int = 10) -> str:
+search_polymarket = _service_tool(
+    "search_polymarket", "polymarket-search",
+    [("query", str, _REQUIRED), ("limit", int, 10)],
     """
     Search Polymarket events by keyword.
     
@@ -853,13 +1619,12 @@ async def search_polymarket(query: str, limit: int = 10) -> str:
         Matching prediction markets with current odds.
     
     Price: $0.25
-    """
-    payload = {"query": query, "limit": limit}
-    result = await call_coinrailz_service("polymarket-search", payload)
-    return json.dumps(result, indent=2)
+    """,
+)
 
-@mcp.tool()
-async def get_prediction_market_odds(event_id: str = None, query: str = None) -> str:
+get_prediction_market_odds = _service_tool(
+    "get_prediction_market_odds", "prediction-market-odds",
+    [("event_id", str, None), ("query", str, None)],
     """
     Get prediction market odds (aggregated from multiple sources).
     
@@ -871,22 +1636,17 @@ async def get_prediction_market_odds(event_id: str = None, query: str = None) ->
         Current odds, volume, and market details for prediction events.
     
     Price: $0.50
-    """
-    payload = {}
-    if event_id:
-        payload["eventId"] = event_id
-    if query:
-        payload["query"] = query
-    result = await call_coinrailz_service("prediction-market-odds", payload)
-    return json.dumps(result, indent=2)
+    """,
+)
 
 
 # =============================================================================
 # CATEGORY 8: AI AGENT INFRASTRUCTURE (3 services)
 # =============================================================================
 
-@mcp.tool()
-async def create_agent_wallet(agent_name: str, agent_type: str = "trading") -> str:
+create_agent_wallet = _service_tool(
+    "create_agent_wallet", "agent-create-wallet",
+    [("agent_name", str, _REQUIRED), ("agent_type", str, "trading")],
     """
     Create a new persistent wallet for an AI agent via Coinbase CDP.
     
@@ -898,13 +1658,12 @@ async def create_agent_wallet(agent_name: str, agent_type: str = "trading") -> s
         New wallet address and management details.
     
     Price: $2.00
-    """
-    payload = {"agentName": agent_name, "agentType": agent_type}
-    result = await call_coinrailz_service("agent-create-wallet", payload)
-    return json.dumps(result, indent=2)
+    """,
+)
 
-@mcp.tool()
-async def create_instant_agent_wallet(purpose: str = "general") -> str:
+create_instant_agent_wallet = _service_tool(
+    "create_instant_agent_wallet", "instant-agent-wallet",
+    [("purpose", str, "general")],
     """
     Instantly create a temporary agent wallet for quick operations.
     
@@ -915,13 +1674,12 @@ async def create_instant_agent_wallet(purpose: str = "general") -> str:
         Temporary wallet address with 24-hour validity.
     
     Price: $1.00
-    """
-    payload = {"purpose": purpose}
-    result = await call_coinrailz_service("instant-agent-wallet", payload)
-    return json.dumps(result, indent=2)
+    """,
+)
 
-@mcp.tool()
-async def verify_agent_identity(agent_address: str, proof: str = None) -> str:
+verify_agent_identity = _service_tool(
+    "verify_agent_identity", "verified-agent-identity",
+    [("agent_address", str, _REQUIRED), ("proof", str, None)],
     """
     Verify and register an AI agent's on-chain identity (ERC-8004).
     
@@ -933,20 +1691,21 @@ async def verify_agent_identity(agent_address: str, proof: str = None) -> str:
         Verification status and on-chain identity NFT details.
     
     Price: $5.00
-    """
-    payload = {"agentAddress": agent_address}
-    if proof:
-        payload["proof"] = proof
-    result = await call_coinrailz_service("verified-agent-identity", payload)
-    return json.dumps(result, indent=2)
+    """,
+)
 
 
 # =============================================================================
 # CATEGORY 9: ENTERPRISE SERVICES (3 services)
 # =============================================================================
 
-@mcp.tool()
-async def request_smart_contract_audit(contract_address: str, chain: str = "ethereum", scope: str = "full") -> str:
+request_smart_contract_audit = _service_tool(
+    "request_smart_contract_audit", "smart-contract-audit",
+    [
+        ("contract_address", str, _REQUIRED),
+        ("chain", str, "ethereum"),
+        ("scope", str, "full"),
+    ],
     """
     Request comprehensive smart contract security audit.
     
@@ -959,21 +1718,16 @@ async def request_smart_contract_audit(contract_address: str, chain: str = "ethe
         Audit request confirmation and estimated delivery time.
     
     Price: $10.00
-    """
-    payload = {
-        "contractAddress": contract_address,
-        "chain": chain,
-        "scope": scope
-    }
-    result = await call_coinrailz_service("smart-contract-audit", payload)
-    return json.dumps(result, indent=2)
-
-@mcp.tool()
-async def request_payment_processing(
-    merchant_id: str,
-    payment_type: str = "one-time",
-    currencies: List[str] = None
-) -> str:
+    """,
+)
+
+request_payment_processing = _service_tool(
+    "request_payment_processing", "payment-processing",
+    [
+        ("merchant_id", str, _REQUIRED),
+        ("payment_type", str, "one-time"),
+        ("currencies", Optional[Sequence[str]], None, _or_default(_DEFAULT_CURRENCIES)),
+    ],
     """
     Set up multi-chain payment processing for merchants.
     
@@ -986,21 +1740,16 @@ async def request_payment_processing(
         Payment processing setup details and integration instructions.
     
     Price: $0.50
-    """
-    payload = {
-        "merchantId": merchant_id,
-        "paymentType": payment_type,
-        "currencies": currencies or ["USDC", "ETH", "USDT"]
-    }
-    result = await call_coinrailz_service("payment-processing", payload)
-    return json.dumps(result, indent=2)
-
-@mcp.tool()
-async def request_compliance_consultation(
-    entity_type: str,
-    jurisdictions: List[str],
-    services: List[str]
-) -> str:
+    """,
+)
+
+request_compliance_consultation = _service_tool(
+    "request_compliance_consultation", "compliance-consultation",
+    [
+        ("entity_type", str, _REQUIRED),
+        ("jurisdictions", Sequence[str], _REQUIRED),
+        ("services", Sequence[str], _REQUIRED),
+    ],
     """
     Request AML/KYC compliance consultation.
     
@@ -1013,27 +1762,22 @@ async def request_compliance_consultation(
         Consultation request confirmation and preliminary assessment.
     
     Price: $5.00
-    """
-    payload = {
-        "entityType": entity_type,
-        "jurisdictions": jurisdictions,
-        "services": services
-    }
-    result = await call_coinrailz_service("compliance-consultation", payload)
-    return json.dumps(result, indent=2)
+    """,
+)
 
 
 # =============================================================================
 # CATEGORY 10: TRADITIONAL MARKETS (2 services)
 # =============================================================================
 
-@mcp.tool()
-async def get_stock_sentiment(
-    symbol: str,
-    include_news: bool = True,
-    include_technicals: bool = True,
-    include_institutional: bool = True
-) -> str:
+get_stock_sentiment = _service_tool(
+    "get_stock_sentiment", "stock-sentiment",
+    [
+        ("symbol", str, _REQUIRED, _norm_ticker),
+        ("include_news", bool, True),
+        ("include_technicals", bool, True),
+        ("include_institutional", bool, True),
+    ],
     """
     Get AI-powered stock market sentiment analysis.
     
@@ -1047,23 +1791,17 @@ async def get_stock_sentiment(
         Sentiment analysis with overall rating, confidence score, key drivers, and trading recommendation.
     
     Price: $0.40
-    """
-    payload = {
-        "symbol": symbol.upper(),
-        "includeNews": include_news,
-        "includeTechnicals": include_technicals,
-        "includeInstitutional": include_institutional
-    }
-    result = await call_coinrailz_service("stock-sentiment", payload)
-    return json.dumps(result, indent=2)
-
-@mcp.tool()
-async def get_forex_sentiment(
-    pair: str,
-    include_economic: bool = True,
-    include_central_bank: bool = True,
-    include_geopolitical: bool = True
-) -> str:
+    """,
+)
+
+get_forex_sentiment = _service_tool(
+    "get_forex_sentiment", "forex-sentiment",
+    [
+        ("pair", str, _REQUIRED, _norm_ticker),
+        ("include_economic", bool, True),
+        ("include_central_bank", bool, True),
+        ("include_geopolitical", bool, True),
+    ],
     """
     Get AI-powered forex currency pair sentiment analysis.
     
@@ -1077,23 +1815,17 @@ async def get_forex_sentiment(
         Sentiment analysis with overall rating, confidence score, key drivers, and trading recommendation.
     
     Price: $0.40
-    """
-    payload = {
-        "pair": pair.upper(),
-        "includeEconomic": include_economic,
-        "includeCentralBank": include_central_bank,
-        "includeGeopolitical": include_geopolitical
-    }
-    result = await call_coinrailz_service("forex-sentiment", payload)
-    return json.dumps(result, indent=2)
+    """,
+)
 
 
 # =============================================================================
 # CATEGORY 11: KALSHI PREDICTION MARKETS (3 services)
 # =============================================================================
 
-@mcp.tool()
-async def get_kalshi_markets(category: str = None, limit: int = 20) -> str:
+get_kalshi_markets = _service_tool(
+    "get_kalshi_markets", "kalshi-markets",
+    [("category", str, None), ("limit", int, 20)],
     """
     Get active markets from Kalshi, a CFTC-regulated prediction exchange.
     
@@ -1105,15 +1837,12 @@ async def get_kalshi_markets(category: str = None, limit: int = 20) -> str:
         Active Kalshi markets with current odds, volume, and resolution criteria.
     
     Price: $0.25
-    """
-    payload = {"limit": limit}
-    if category:
-        payload["category"] = category
-    result = await call_coinrailz_service("kalshi-markets", payload)
-    return json.dumps(result, indent=2)
+    """,
+)
 
-@mcp.tool()
-async def get_kalshi_odds(market_ticker: str) -> str:
+get_kalshi_odds = _service_tool(
+    "get_kalshi_odds", "kalshi-odds",
+    [("market_ticker", str, _REQUIRED)],
     """
     Get current odds and orderbook for a specific Kalshi market.
     
@@ -1124,13 +1853,12 @@ async def get_kalshi_odds(market_ticker: str) -> str:
         Current yes/no prices, volume, open interest, and order book depth.
     
     Price: $0.25
-    """
-    payload = {"marketTicker": market_ticker}
-    result = await call_coinrailz_service("kalshi-odds", payload)
-    return json.dumps(result, indent=2)
+    """,
+)
 
-@mcp.tool()
-async def search_kalshi(query: str, limit: int = 10) -> str:
+search_kalshi = _service_tool(
+    "search_kalshi", "kalshi-search",
+    [("query", str, _REQUIRED), ("limit", int, 10)],
     """
     Search Kalshi prediction markets by keyword.
     
@@ -1142,23 +1870,22 @@ async def search_kalshi(query: str, limit: int = 10) -> str:
         Matching Kalshi markets with current status and odds.
     
     Price: $0.25
-    """
-    payload = {"query": query, "limit": limit}
-    result = await call_coinrailz_service("kalshi-search", payload)
-    return json.dumps(result, indent=2)
+    """,
+)
 
 
 # =============================================================================
 # CATEGORY 12: SATELLITE & EARTH OBSERVATION (12 services)
 # =============================================================================
 
-@mcp.tool()
-async def get_fire_alerts(
-    latitude: float = None,
-    longitude: float = None,
-    radius_km: float = 100,
-    hours: int = 24
-) -> str:
+get_fire_alerts = _service_tool(
+    "get_fire_alerts", "fire-alerts",
+    [
+        ("latitude", float, None),
+        ("longitude", float, None),
+        ("radius_km", float, 100),
+        ("hours", int, 24),
+    ],
     """
     Get real-time active fire detection data from NASA FIRMS satellites.
     
@@ -1172,21 +1899,16 @@ async def get_fire_alerts(
         Active fire detections with confidence, FRP (fire radiative power), and coordinates.
     
     Price: $0.15
-    """
-    payload = {"radiusKm": radius_km, "hours": hours}
-    if latitude is not None:
-        payload["latitude"] = latitude
-    if longitude is not None:
-        payload["longitude"] = longitude
-    result = await call_coinrailz_service("fire-alerts", payload)
-    return json.dumps(result, indent=2)
-
-@mcp.tool()
-async def get_weather_imagery(
-    latitude: float,
-    longitude: float,
-    layer: str = "GOES_East_ABI_Band13_Clean_Infrared"
-) -> str:
+    """,
+)
+
+get_weather_imagery = _service_tool(
+    "get_weather_imagery", "weather-imagery",
+    [
+        ("latitude", float, _REQUIRED),
+        ("longitude", float, _REQUIRED),
+        ("layer", str, "GOES_East_ABI_Band13_Clean_Infrared"),
+    ],
     """
     Get high-resolution weather satellite imagery from NASA GIBS.
     
@@ -1200,17 +1922,16 @@ async def get_weather_imagery(
         Satellite imagery tile URL, metadata, and current weather pattern description.
     
     Price: $0.15
-    """
-    payload = {"latitude": latitude, "longitude": longitude, "layer": layer}
-    result = await call_coinrailz_service("weather-imagery", payload)
-    return json.dumps(result, indent=2)
+    """,
+)
 
-@mcp.tool()
-async def get_vegetation_health(
-    latitude: float,
-    longitude: float,
-    date: str = None
-) -> str:
+get_vegetation_health = _service_tool(
+    "get_vegetation_health", "vegetation",
+    [
+        ("latitude", float, _REQUIRED),
+        ("longitude", float, _REQUIRED),
+        ("date", str, None),
+    ],
     """
     Get NDVI vegetation health indices from satellite data.
     
@@ -1223,19 +1944,16 @@ async def get_vegetation_health(
         NDVI values, vegetation health classification, and trend vs prior period.
     
     Price: $0.15
-    """
-    payload = {"latitude": latitude, "longitude": longitude}
-    if date:
-        payload["date"] = date
-    result = await call_coinrailz_service("vegetation", payload)
-    return json.dumps(result, indent=2)
+    """,
+)
 
-@mcp.tool()
-async def detect_floods(
-    latitude: float,
-    longitude: float,
-    date: str = None
-) -> str:
+detect_floods = _service_tool(
+    "detect_floods", "flood-detection",
+    [
+        ("latitude", float, _REQUIRED),
+        ("longitude", float, _REQUIRED),
+        ("date", str, None),
+    ],
     """
     Detect flood extent from ESA Sentinel-1 SAR satellite data.
     
@@ -1248,18 +1966,12 @@ async def detect_floods(
         Flood extent mapping, affected area estimate, and change vs baseline.
     
     Price: $0.25
-    """
-    payload = {"latitude": latitude, "longitude": longitude}
-    if date:
-        payload["date"] = date
-    result = await call_coinrailz_service("flood-detection", payload)
-    return json.dumps(result, indent=2)
+    """,
+)
 
-@mcp.tool()
-async def get_air_quality(
-    latitude: float,
-    longitude: float
-) -> str:
+get_air_quality = _service_tool(
+    "get_air_quality", "air-quality",
+    [("latitude", float, _REQUIRED), ("longitude", float, _REQUIRED)],
     """
     Get atmospheric pollutant concentrations from ESA Sentinel-5P satellite.
     
@@ -1271,16 +1983,12 @@ async def get_air_quality(
         NO2, SO2, CO, O3, and aerosol concentrations with AQI classification.
     
     Price: $0.15
-    """
-    payload = {"latitude": latitude, "longitude": longitude}
-    result = await call_coinrailz_service("air-quality", payload)
-    return json.dumps(result, indent=2)
+    """,
+)
 
-@mcp.tool()
-async def get_land_use(
-    latitude: float,
-    longitude: float
-) -> str:
+get_land_use = _service_tool(
+    "get_land_use", "land-use",
+    [("latitude", float, _REQUIRED), ("longitude", float, _REQUIRED)],
     """
     Get land cover classification from ESA WorldCover satellite data.
     
@@ -1292,18 +2000,17 @@ async def get_land_use(
         Land use classification (cropland, forest, urban, water, etc.) with percentages.
     
     Price: $0.15
-    """
-    payload = {"latitude": latitude, "longitude": longitude}
-    result = await call_coinrailz_service("land-use", payload)
-    return json.dumps(result, indent=2)
-
-@mcp.tool()
-async def get_satellite_earthdata(
-    dataset: str,
-    latitude: float = None,
-    longitude: float = None,
-    date: str = None
-) -> str:
+    """,
+)
+
+get_satellite_earthdata = _service_tool(
+    "get_satellite_earthdata", "satellite-earthdata",
+    [
+        ("dataset", str, _REQUIRED),
+        ("latitude", float, None),
+        ("longitude", float, None),
+        ("date", str, None),
+    ],
     """
     NASA Earthdata gateway — access precipitation, SST, soil moisture, and ocean data.
     
@@ -1317,26 +2024,19 @@ async def get_satellite_earthdata(
         NASA satellite data for the requested dataset and location.
     
     Price: $0.25
-    """
-    payload = {"dataset": dataset}
-    if latitude is not None:
-        payload["latitude"] = latitude
-    if longitude is not None:
-        payload["longitude"] = longitude
-    if date:
-        payload["date"] = date
-    result = await call_coinrailz_service("satellite-earthdata", payload)
-    return json.dumps(result, indent=2)
-
-@mcp.tool()
-async def search_earthdata_granules(
-    short_name: str,
-    latitude: float = None,
-    longitude: float = None,
-    date_start: str = None,
-    date_end: str = None,
-    limit: int = 10
-) -> str:
+    """,
+)
+
+search_earthdata_granules = _service_tool(
+    "search_earthdata_granules", "earthdata-granules",
+    [
+        ("short_name", str, _REQUIRED),
+        ("latitude", float, None),
+        ("longitude", float, None),
+        ("date_start", str, None),
+        ("date_end", str, None),
+        ("limit", int, 10),
+    ],
     """
     Search 1B+ NASA satellite granules in the Earthdata catalog.
     
@@ -1352,25 +2052,16 @@ async def search_earthdata_granules(
         Granule metadata including download URLs, coverage, and file sizes.
     
     Price: $0.25
-    """
-    payload = {"shortName": short_name, "limit": limit}
-    if latitude is not None:
-        payload["latitude"] = latitude
-    if longitude is not None:
-        payload["longitude"] = longitude
-    if date_start:
-        payload["dateStart"] = date_start
-    if date_end:
-        payload["dateEnd"] = date_end
-    result = await call_coinrailz_service("earthdata-granules", payload)
-    return json.dumps(result, indent=2)
-
-@mcp.tool()
-async def get_precipitation_data(
-    latitude: float,
-    longitude: float,
-    date: str = None
-) -> str:
+    """,
+)
+
+get_precipitation_data = _service_tool(
+    "get_precipitation_data", "earthdata-precipitation",
+    [
+        ("latitude", float, _REQUIRED),
+        ("longitude", float, _REQUIRED),
+        ("date", str, None),
+    ],
     """
     Get real-time observed rain rate and accumulated precipitation from NASA GPM.
     
@@ -1383,19 +2074,16 @@ async def get_precipitation_data(
         Precipitation rate (mm/hr), accumulation, and storm tracking data.
     
     Price: $0.25
-    """
-    payload = {"latitude": latitude, "longitude": longitude}
-    if date:
-        payload["date"] = date
-    result = await call_coinrailz_service("earthdata-precipitation", payload)
-    return json.dumps(result, indent=2)
+    """,
+)
 
-@mcp.tool()
-async def get_sea_surface_temperature(
-    latitude: float,
-    longitude: float,
-    date: str = None
-) -> str:
+get_sea_surface_temperature = _service_tool(
+    "get_sea_surface_temperature", "earthdata-sst",
+    [
+        ("latitude", float, _REQUIRED),
+        ("longitude", float, _REQUIRED),
+        ("date", str, None),
+    ],
     """
     Get sea surface temperature from NASA MODIS satellite data.
     
@@ -1408,19 +2096,16 @@ async def get_sea_surface_temperature(
         SST in Celsius/Fahrenheit, anomaly vs climatological mean, and trend.
     
     Price: $0.25
-    """
-    payload = {"latitude": latitude, "longitude": longitude}
-    if date:
-        payload["date"] = date
-    result = await call_coinrailz_service("earthdata-sst", payload)
-    return json.dumps(result, indent=2)
+    """,
+)
 
-@mcp.tool()
-async def get_soil_moisture(
-    latitude: float,
-    longitude: float,
-    date: str = None
-) -> str:
+get_soil_moisture = _service_tool(
+    "get_soil_moisture", "earthdata-soil-moisture",
+    [
+        ("latitude", float, _REQUIRED),
+        ("longitude", float, _REQUIRED),
+        ("date", str, None),
+    ],
     """
     Get soil moisture granule data from NASA SMAP satellite.
     
@@ -1433,19 +2118,16 @@ async def get_soil_moisture(
         Volumetric soil moisture content, freeze/thaw state, and agricultural relevance.
     
     Price: $0.25
-    """
-    payload = {"latitude": latitude, "longitude": longitude}
-    if date:
-        payload["date"] = date
-    result = await call_coinrailz_service("earthdata-soil-moisture", payload)
-    return json.dumps(result, indent=2)
+    """,
+)
 
-@mcp.tool()
-async def get_ocean_color(
-    latitude: float,
-    longitude: float,
-    date: str = None
-) -> str:
+get_ocean_color = _service_tool(
+    "get_ocean_color", "earthdata-ocean-color",
+    [
+        ("latitude", float, _REQUIRED),
+        ("longitude", float, _REQUIRED),
+        ("date", str, None),
+    ],
     """
     Get MODIS Aqua ocean chlorophyll-a concentration and water quality data.
     
@@ -1458,24 +2140,21 @@ async def get_ocean_color(
         Chlorophyll-a concentration (mg/m³), ocean color index, and phytoplankton activity.
     
     Price: $0.25
-    """
-    payload = {"latitude": latitude, "longitude": longitude}
-    if date:
-        payload["date"] = date
-    result = await call_coinrailz_service("earthdata-ocean-color", payload)
-    return json.dumps(result, indent=2)
+    """,
+)
 
 
 # =============================================================================
 # CATEGORY 13: IoT & DePIN DATA (5 services)
 # =============================================================================
 
-@mcp.tool()
-async def get_fleet_telematics(
-    device_id: str = None,
-    fleet_id: str = None,
-    limit: int = 10
-) -> str:
+get_fleet_telematics = _service_tool(
+    "get_fleet_telematics", "fleet-telematics",
+    [
+        ("device_id", str, None),
+        ("fleet_id", str, None),
+        ("limit", int, 10),
+    ],
     """
     Get real-time fleet data: GPS location, fuel, speed, and diagnostics from IoT devices.
     
@@ -1488,22 +2167,17 @@ async def get_fleet_telematics(
         GPS coordinates, speed, fuel level, engine diagnostics, and last-seen timestamp.
     
     Price: $0.10
-    """
-    payload = {"limit": limit}
-    if device_id:
-        payload["deviceId"] = device_id
-    if fleet_id:
-        payload["fleetId"] = fleet_id
-    result = await call_coinrailz_service("fleet-telematics", payload)
-    return json.dumps(result, indent=2)
-
-@mcp.tool()
-async def get_weather_station_data(
-    station_id: str = None,
-    latitude: float = None,
-    longitude: float = None,
-    radius_km: float = 10
-) -> str:
+    """,
+)
+
+get_weather_station_data = _service_tool(
+    "get_weather_station_data", "weather-station-data",
+    [
+        ("station_id", str, None),
+        ("latitude", float, None),
+        ("longitude", float, None),
+        ("radius_km", float, 10),
+    ],
     """
     Get hyperlocal weather data from IoT weather station network.
     
@@ -1517,19 +2191,12 @@ async def get_weather_station_data(
         Temperature, humidity, pressure, wind speed/direction, and precipitation.
     
     Price: $0.10
-    """
-    payload = {"radiusKm": radius_km}
-    if station_id:
-        payload["stationId"] = station_id
-    if latitude is not None:
-        payload["latitude"] = latitude
-    if longitude is not None:
-        payload["longitude"] = longitude
-    result = await call_coinrailz_service("weather-station-data", payload)
-    return json.dumps(result, indent=2)
+    """,
+)
 
-@mcp.tool()
-async def read_iot_sensor(device_id: str, sensor_type: str = "all") -> str:
+read_iot_sensor = _service_tool(
+    "read_iot_sensor", "iot-sensor-reading",
+    [("device_id", str, _REQUIRED), ("sensor_type", str, "all")],
     """
     Get a single sensor reading from a registered IoT device.
     
@@ -1542,13 +2209,15 @@ async def read_iot_sensor(device_id: str, sensor_type: str = "all") -> str:
         Current sensor value(s) with unit, timestamp, and device metadata.
     
     Price: $0.05
-    """
-    payload = {"deviceId": device_id, "sensorType": sensor_type}
-    result = await call_coinrailz_service("iot-sensor-reading", payload)
-    return json.dumps(result, indent=2)
+    """,
+)
 
-@mcp.tool()
-async def stream_iot_device(device_id: str, duration_seconds: int = 60) -> str:
+stream_iot_device = _service_tool(
+    "stream_iot_device", "iot-device-stream",
+    [
+        ("device_id", str, _REQUIRED),
+        ("duration_seconds", int, 60, _at_most(300)),
+    ],
     """
     Get real-time data stream from an IoT device.
     
@@ -1560,18 +2229,17 @@ async def stream_iot_device(device_id: str, duration_seconds: int = 60) -> str:
         Time-series sensor readings for the requested duration.
     
     Price: $0.10
-    """
-    payload = {"deviceId": device_id, "durationSeconds": min(duration_seconds, 300)}
-    result = await call_coinrailz_service("iot-device-stream", payload)
-    return json.dumps(result, indent=2)
-
-@mcp.tool()
-async def export_iot_bulk_data(
-    device_id: str,
-    start_date: str,
-    end_date: str,
-    format: str = "json"
-) -> str:
+    """,
+)
+
+export_iot_bulk_data = _service_tool(
+    "export_iot_bulk_data", "iot-bulk-data",
+    [
+        ("device_id", str, _REQUIRED),
+        ("start_date", str, _REQUIRED),
+        ("end_date", str, _REQUIRED),
+        ("format", str, "json"),
+    ],
     """
     Export historical bulk data from an IoT device.
     
@@ -1585,28 +2253,22 @@ async def export_iot_bulk_data(
         Historical sensor data export with download URL and record count.
     
     Price: $0.25
-    """
-    payload = {
-        "deviceId": device_id,
-        "startDate": start_date,
-        "endDate": end_date,
-        "format": format
-    }
-    result = await call_coinrailz_service("iot-bulk-data", payload)
-    return json.dumps(result, indent=2)
+    """,
+)
 
 
 # =============================================================================
 # CATEGORY 14: AI INFERENCE & YIELD (2 services)
 # =============================================================================
 
-@mcp.tool()
-async def run_ai_inference(
-    prompt: str,
-    model: str = "gpt-4o-mini",
-    max_tokens: int = 500,
-    system_prompt: str = None
-) -> str:
+run_ai_inference = _service_tool(
+    "run_ai_inference", "ai-inference",
+    [
+        ("prompt", str, _REQUIRED),
+        ("model", str, "gpt-4o-mini"),
+        ("max_tokens", int, 500, _at_most(4000)),
+        ("system_prompt", str, None),
+    ],
     """
     Pay-per-call GPT-4o-mini inference via x402 USDC micropayments.
     Ideal for agents that need AI capabilities without managing OpenAI API keys.
@@ -1621,23 +2283,16 @@ async def run_ai_inference(
         AI-generated text response with token usage and cost breakdown.
     
     Price: $0.05
-    """
-    payload = {
-        "prompt": prompt,
-        "model": model,
-        "maxTokens": min(max_tokens, 4000)
-    }
-    if system_prompt:
-        payload["systemPrompt"] = system_prompt
-    result = await call_coinrailz_service("ai-inference", payload)
-    return json.dumps(result, indent=2)
-
-@mcp.tool()
-async def find_solana_yield(
-    min_apy: float = 0.0,
-    max_risk: str = "medium",
-    asset: str = "USDC"
-) -> str:
+    """,
+)
+
+find_solana_yield = _service_tool(
+    "find_solana_yield", "solana-yield-finder",
+    [
+        ("min_apy", float, 0.0),
+        ("max_risk", str, "medium"),
+        ("asset", str, "USDC"),
+    ],
     """
     Get real-time Solana lending and yield opportunities from Kamino and other protocols.
     
@@ -1650,10 +2305,77 @@ async def find_solana_yield(
         Ranked yield opportunities with current APY, TVL, protocol, and risk rating.
     
     Price: $0.25
+    """,
+)
+
+
+# =============================================================================
+# HELPER TOOLS
+# =============================================================================
+
+@_register_tool
+async def poll_coinrailz_job(job_id: str) -> dict[str, Any]:
+    """
+    Check on a long-running job started by another Coin Railz tool.
+    
+    Contract scans, lease analysis, property valuation, portfolio optimization
+    and credit risk scoring may return a jobId instead of a finished result.
+    
+    Args:
+        job_id: The jobId returned by the original tool call
+    
+    Returns:
+        Job status, and the service result once the job has completed.
     """
-    payload = {"minApy": min_apy, "maxRisk": max_risk, "asset": asset}
-    result = await call_coinrailz_service("solana-yield-finder", payload)
-    return json.dumps(result, indent=2)
+    result = await call_coinrailz_service(f"jobs/{quote(job_id, safe='')}", method="GET")
+    return result
+
+async def _run_batched_call(call: Any) -> dict[str, Any]:
+    """Run one entry of a batch_call request, reporting failures as error dicts."""
+    name = call.get("tool") if isinstance(call, dict) else None
+    tool = mcp._tool_manager.get_tool(name) if isinstance(name, str) else None
+    if tool is None or name == "batch_call":
+        return {"error": "Unknown tool", "tool": name}
+    try:
+        result = await tool.run(call.get("args") or {})
+    except Exception as e:
+        return {"error": "Tool call failed", "tool": name, "message": str(e)}
+    return result.structuredContent if isinstance(result, CallToolResult) else result
+
+@_register_tool
+async def batch_call(calls: List[dict], parallel: bool = True) -> dict[str, Any]:
+    """
+    Run several Coin Railz tools in a single request.
+    
+    Args:
+        calls: Tool calls to run, each {"tool": "<tool name>", "args": {...}},
+               e.g. [{"tool": "get_token_price", "args": {"token_address": "0x..."}}]
+        parallel: Run all calls concurrently. If false, run them in order and
+                  stop at the first call that returns an error.
+    
+    Returns:
+        {"results": [...]} with one entry per executed call, in request order.
+        Failed calls are reported as entries with an "error" key.
+    
+    Price: Sum of the individual tool prices
+    """
+    if len(calls) > BATCH_MAX_CALLS:
+        return {
+            "error": "Too many calls",
+            "message": f"batch_call accepts at most {BATCH_MAX_CALLS} calls per request."
+        }
+    
+    if parallel:
+        results = await asyncio.gather(*(_run_batched_call(call) for call in calls))
+        return {"results": list(results)}
+    
+    results = []
+    for call in calls:
+        result = await _run_batched_call(call)
+        results.append(result)
+        if isinstance(result, dict) and "error" in result:
+            break
+    return {"results": results}
 
 
 # =============================================================================
@@ -1745,89 +2467,91 @@ _PARAM_DESCRIPTIONS: dict[str, str] = {
     "credits": "Number of platform credits to allocate",
     "api_key": "Coin Railz API key (get one free at https://coinrailz.com/credits)",
     "tx_hash": "On-chain transaction hash to look up",
+    "job_id": "Job identifier returned by a long-running service call",
+    "calls": "List of tool calls, each {'tool': '<tool name>', 'args': {...}}",
+    "parallel": "Whether to run the batched calls concurrently",
     "min_apy": "Minimum APY percentage filter (e.g. 3.0 means ≥3% APY)",
 }
 
 _OUTPUT_SCHEMA: dict = {
     "type": "object",
-    "properties": {
-        "result": {
-            "type": "string",
-            "description": "JSON-encoded response data from the Coin Railz service",
-        }
-    },
-    "required": ["result"],
+    "description": "Decoded JSON response from the Coin Railz service",
+    "additionalProperties": True,
+}
+
+
+# Tools that change state on the Coin Railz side (and batch_call, which can
+# run them); every other tool is advertised as read-only and idempotent.
+_STATE_CHANGING_TOOLS = {
+    "create_agent_wallet",
+    "create_instant_agent_wallet",
+    "verify_agent_identity",
+    "request_smart_contract_audit",
+    "request_payment_processing",
+    "request_compliance_consultation",
+    "batch_call",
 }
 
 
 def _enrich_mcp_tools() -> None:
     """
-    Wrap FastMCP's tool manager list_tools() to inject Smithery-required
-    quality metadata: outputSchema, ToolAnnotations, and inputSchema
-    property descriptions.
+    Add Smithery-required quality metadata to the registered tools: outputSchema
+    details, ToolAnnotations, and inputSchema property descriptions.
+    
+    The tool objects are updated in place once, at import, so FastMCP's own
+    list_tools handler serves the enriched metadata without rebuilding it.
     """
     try:
         from mcp import types as _t
 
-        tool_mgr = mcp._tool_manager
-        _orig_list = tool_mgr.list_tools
-
-        async def _enriched_list_tools():
-            tools = await _orig_list()
-            enriched = []
-            for tool in tools:
-                # --- Enrich inputSchema property descriptions ---
-                raw_schema = tool.inputSchema or {"type": "object", "properties": {}}
-                props = {
-                    k: (dict(v) | {"description": _PARAM_DESCRIPTIONS.get(k, f'Value for the "{k}" parameter')})
-                    if "description" not in v else v
-                    for k, v in (raw_schema.get("properties") or {}).items()
-                }
-                schema = dict(raw_schema)
-                schema["properties"] = props
-
-                # --- Build enriched Tool ---
-                tool_kwargs: dict = {
-                    "name": tool.name,
-                    "description": tool.description,
-                    "inputSchema": schema,
-                }
+        for tool in mcp._tool_manager.list_tools():
+            # --- Enrich inputSchema property descriptions ---
+            for name, prop in (tool.parameters.get("properties") or {}).items():
+                prop.setdefault(
+                    "description", _PARAM_DESCRIPTIONS.get(name, f'Value for the "{name}" parameter')
+                )
 
-                # annotations (MCP 2025-03-26+)
+            # annotations (MCP 2025-03-26+)
+            if hasattr(tool, "annotations") and tool.annotations is None:
+                read_only = tool.name not in _STATE_CHANGING_TOOLS
                 try:
-                    tool_kwargs["annotations"] = _t.ToolAnnotations(
+                    tool.annotations = _t.ToolAnnotations(
                         audience=["assistant"],
-                        readOnlyHint=True,
-                        idempotentHint=True,
+                        readOnlyHint=read_only,
+                        idempotentHint=read_only,
                         destructiveHint=False,
                         priority=0.7,
                     )
                 except Exception:
                     pass
 
-                # outputSchema (MCP 2025-06-18+, gracefully skip if unsupported)
-                try:
-                    tool_kwargs["outputSchema"] = _OUTPUT_SCHEMA
-                    enriched.append(_t.Tool(**tool_kwargs))
-                except Exception:
-                    tool_kwargs.pop("outputSchema", None)
-                    enriched.append(_t.Tool(**tool_kwargs))
-
-            return enriched
-
-        tool_mgr.list_tools = _enriched_list_tools
+            # outputSchema (MCP 2025-06-18+); the SDK derives it from the
+            # dict[str, Any] return annotation, so only fill in the details.
+            output_schema = getattr(getattr(tool, "fn_metadata", None), "output_schema", None)
+            if isinstance(output_schema, dict):
+                for key, value in _OUTPUT_SCHEMA.items():
+                    output_schema.setdefault(key, value)
     except Exception:
         # Never crash the server over enrichment failures
         pass
 
 
-# Run enrichment at import time (after all @mcp.tool() decorators)
+# Run enrichment at import time (after all tools are registered)
 _enrich_mcp_tools()
 
 
+async def _serve() -> None:
+    """Run the stdio server, then flush telemetry and close the shared client."""
+    try:
+        await mcp.run_stdio_async()
+    finally:
+        await _stop_telemetry(timeout=2)
+        await _close_client()
+
+
 def main():
     """Run the MCP server (synchronous entry point for CLI)."""
-    mcp.run()
+    asyncio.run(_serve())
 
 
 if __name__ == "__main__":